@@ -0,0 +1,33 @@
+"""Tests for cached report generation."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from tracker.reports import ReportGenerator
+
+
+class TestGenerateMissingDailyReports:
+    """Test catch-up generation of missing daily reports."""
+
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_counts_generated_reports(self, monkeypatch, max_workers):
+        """Each missing day is generated once; days without data don't count."""
+        storage = Mock()
+        storage.get_missing_daily_reports.return_value = [
+            '2025-01-04', '2025-01-05', '2025-01-06',
+        ]
+        generator = ReportGenerator(storage, Mock(), Mock())
+        generated = []
+
+        def generate_daily_report(date_str):
+            generated.append(date_str)
+            return None if date_str == '2025-01-05' else {'date': date_str}
+
+        monkeypatch.setattr(generator, 'generate_daily_report', generate_daily_report)
+
+        count = generator.generate_missing_daily_reports(days_back=3, max_workers=max_workers)
+
+        assert count == 2
+        assert sorted(generated) == ['2025-01-04', '2025-01-05', '2025-01-06']
+        storage.get_missing_daily_reports.assert_called_once_with(3)
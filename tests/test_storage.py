@@ -82,6 +82,10 @@ class TestActivityStorage:
             
             # Connection should be active
             conn.execute("SELECT 1")
+
+            # WAL journal with relaxed fsync for faster commits
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
     
     def test_save_screenshot_basic(self, test_db_path, sample_file_with_mtime):
         """Test basic screenshot saving functionality."""
@@ -239,7 +243,177 @@ class TestActivityStorage:
         
         screenshot = storage.get_screenshot(999999)
         assert screenshot is None
-    
+
+    def test_get_screenshots_by_ids(self, populated_storage, monkeypatch):
+        """Test batch lookup preserves input order and skips missing IDs."""
+        storage, test_files = populated_storage
+
+        with storage.get_connection() as conn:
+            cursor = conn.execute("SELECT id FROM screenshots ORDER BY timestamp")
+            ids = [row['id'] for row in cursor.fetchall()]
+
+        requested = [ids[2], 999999, ids[0], ids[1], ids[0]]
+        screenshots = storage.get_screenshots_by_ids(requested)
+        assert [s['id'] for s in screenshots] == [ids[2], ids[0], ids[1]]
+        assert screenshots[0]['window_title'] == "Test Window 2"
+
+        # Chunking across multiple statements gives the same result
+        monkeypatch.setattr(ActivityStorage, "MAX_QUERY_PARAMS", 1)
+        assert storage.get_screenshots_by_ids(requested) == screenshots
+
+        assert storage.get_screenshots_by_ids([]) == []
+
+    def test_ocr_text_cache(self, populated_storage, monkeypatch):
+        """Test OCR text round-trips per screenshot and crop mode."""
+        storage, test_files = populated_storage
+
+        with storage.get_connection() as conn:
+            cursor = conn.execute("SELECT id FROM screenshots ORDER BY timestamp")
+            ids = [row['id'] for row in cursor.fetchall()]
+
+        storage.save_ocr_texts({ids[0]: "full", ids[1]: "other"}, cropped=False)
+        storage.save_ocr_texts({ids[0]: "cropped"}, cropped=True)
+        storage.save_ocr_texts({ids[1]: "updated"}, cropped=False)
+
+        monkeypatch.setattr(ActivityStorage, "MAX_QUERY_PARAMS", 1)
+        assert storage.get_ocr_texts(ids, cropped=False) == {
+            ids[0]: "full", ids[1]: "updated",
+        }
+        assert storage.get_ocr_texts(ids, cropped=True) == {ids[0]: "cropped"}
+        assert storage.get_ocr_texts([], cropped=False) == {}
+
+    def test_get_session_intervals(self, test_db_path):
+        """Test session intervals agree with has_active_session_in_range."""
+        from datetime import datetime
+
+        storage = ActivityStorage(test_db_path)
+        first = storage.create_session(datetime(2025, 1, 6, 9, 0))
+        storage.end_session(first, datetime(2025, 1, 6, 9, 30), 1800)
+        storage.create_session(datetime(2025, 1, 6, 11, 0))  # still active
+
+        range_start, range_end = datetime(2025, 1, 6, 9, 15), datetime(2025, 1, 6, 12, 0)
+        assert storage.get_session_intervals(range_start, range_end) == [
+            (datetime(2025, 1, 6, 9, 0), datetime(2025, 1, 6, 9, 30)),
+            (datetime(2025, 1, 6, 11, 0), None),
+        ]
+
+        gap_start, gap_end = datetime(2025, 1, 6, 9, 30), datetime(2025, 1, 6, 11, 0)
+        assert storage.get_session_intervals(gap_start, gap_end) == []
+        assert not storage.has_active_session_in_range(gap_start, gap_end)
+
+    def test_get_time_range_status(self, test_db_path):
+        """Test the combined slot check matches the two separate checks."""
+        from datetime import datetime
+
+        storage = ActivityStorage(test_db_path)
+        session = storage.create_session(datetime(2025, 1, 6, 9, 0))
+        storage.end_session(session, datetime(2025, 1, 6, 9, 30), 1800)
+
+        slot = (datetime(2025, 1, 6, 9, 15), datetime(2025, 1, 6, 9, 30))
+        afk_slot = (datetime(2025, 1, 6, 9, 30), datetime(2025, 1, 6, 9, 45))
+        assert storage.get_time_range_status(*slot) == (False, True)
+        assert storage.get_time_range_status(*afk_slot) == (False, False)
+
+        with storage.get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO threshold_summaries
+                    (start_time, end_time, summary, screenshot_ids,
+                     screenshot_count, model_used)
+                VALUES (?, ?, 'summary', '[]', 0, 'model')
+                """,
+                (slot[0].isoformat(), slot[1].isoformat()),
+            )
+            conn.commit()
+        assert storage.get_time_range_status(*slot) == (True, True)
+        assert storage.has_summary_for_time_range(slot[0].isoformat(), slot[1].isoformat())
+
+    def test_get_focus_events_clipped_to_range(self, test_db_path):
+        """Test durations are clipped to the range; outside events dropped."""
+        from datetime import datetime
+
+        storage = ActivityStorage(test_db_path)
+        events = [
+            (datetime(2025, 1, 6, 9, 55), datetime(2025, 1, 6, 10, 5)),
+            (datetime(2025, 1, 6, 10, 5), datetime(2025, 1, 6, 10, 10)),
+            (datetime(2025, 1, 6, 10, 10, 0, 500000), datetime(2025, 1, 6, 10, 30)),
+            (datetime(2025, 1, 6, 9, 0), datetime(2025, 1, 6, 9, 30)),
+        ]
+        for i, (start, end) in enumerate(events):
+            storage.save_focus_event(f"Window {i}", "App", "app", start, end)
+
+        clipped = storage.get_focus_events_clipped_to_range(
+            datetime(2025, 1, 6, 10, 0), datetime(2025, 1, 6, 10, 15)
+        )
+
+        assert [e['window_title'] for e in clipped] == ["Window 0", "Window 1", "Window 2"]
+        assert [e['duration_seconds'] for e in clipped] == pytest.approx([300, 300, 299.5])
+
+    def test_get_focus_events_clipped_to_range_formats(self, test_db_path):
+        """Test stored time variants are clipped; unparseable times are dropped."""
+        from datetime import datetime
+
+        storage = ActivityStorage(test_db_path)
+        rows = [
+            ("Spaces", '2025-01-06 10:05:00', '2025-01-06 10:10:00', 300),
+            ("Zulu", '2025-01-06T10:10:00.500000', '2025-01-06T10:30:00Z', 1200),
+            ("Garbage", 'garbage', '2025-01-06T10:05:00', 42),
+        ]
+        with storage.get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO window_focus_events
+                    (window_title, app_name, start_time, end_time, duration_seconds)
+                VALUES (?, 'App', ?, ?, ?)
+                """,
+                rows,
+            )
+            conn.commit()
+
+        clipped = storage.get_focus_events_clipped_to_range(
+            datetime(2025, 1, 6, 10, 0), datetime(2025, 1, 6, 10, 15)
+        )
+
+        assert [e['window_title'] for e in clipped] == ["Spaces", "Zulu"]
+        assert [e['duration_seconds'] for e in clipped] == pytest.approx([300, 299.5])
+
+    def test_get_unsummarized_screenshots_order(self, populated_storage):
+        """Test unsummarized screenshots are newest first unless oldest_first."""
+        storage, test_files = populated_storage
+
+        newest_first = storage.get_unsummarized_screenshots(require_session=False)
+        oldest_first = storage.get_unsummarized_screenshots(
+            require_session=False, oldest_first=True
+        )
+
+        assert [s['timestamp'] for s in oldest_first] == [ts for _, ts in test_files]
+        assert oldest_first == newest_first[::-1]
+
+    def test_get_sessions_up_to(self, test_db_path):
+        """Test the target session comes first, followed by older sessions."""
+        from datetime import datetime
+
+        storage = ActivityStorage(test_db_path)
+        bounds = [
+            (datetime(2025, 1, 6, 9, 0), datetime(2025, 1, 6, 9, 30)),
+            (datetime(2025, 1, 6, 9, 30, 20), datetime(2025, 1, 6, 10, 0)),
+            (datetime(2025, 1, 6, 11, 0), datetime(2025, 1, 6, 12, 0)),
+        ]
+        ids = []
+        for start, end in bounds:
+            session_id = storage.create_session(start)
+            storage.end_session(session_id, end, int((end - start).total_seconds()))
+            ids.append(session_id)
+        active_id = storage.create_session(datetime(2025, 1, 6, 13, 0))
+
+        sessions = storage.get_sessions_up_to(ids[1])
+        assert [s['id'] for s in sessions] == [ids[1], ids[0]]
+        assert sessions[0]['start_seconds'] - sessions[1]['end_seconds'] == pytest.approx(20)
+
+        assert [s['id'] for s in storage.get_sessions_up_to(ids[2], limit=2)] == [ids[2], ids[1]]
+        assert storage.get_sessions_up_to(active_id) == []
+        assert storage.get_sessions_up_to(999999) == []
+
     def test_database_persistence(self, test_db_path, sample_file_with_mtime):
         """Test that data persists across storage instances."""
         filepath, expected_timestamp = sample_file_with_mtime
@@ -0,0 +1,603 @@
+"""Tests for the background summarization worker.
+
+These tests exercise the worker's scheduling and bookkeeping logic with a
+mocked storage layer; no LLM or OCR calls are made.
+"""
+
+import os
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from tracker.config import ConfigManager
+from tracker import summarizer_worker
+from tracker.summarizer_worker import SummarizerWorker
+
+
+@pytest.fixture
+def config_manager(tmp_path):
+    """ConfigManager backed by a temporary (non-existent) config file."""
+    return ConfigManager(tmp_path / "config.yaml")
+
+
+@pytest.fixture
+def storage():
+    """Mock ActivityStorage."""
+    storage = Mock()
+    storage.get_ocr_texts.return_value = {}
+    return storage
+
+
+@pytest.fixture
+def worker(storage, config_manager):
+    """SummarizerWorker that is never started."""
+    return SummarizerWorker(storage, config_manager)
+
+
+@pytest.fixture
+def summarizer(worker, config_manager):
+    """Install a mock HybridSummarizer on the worker."""
+    summarizer = Mock()
+    summarizer.is_available.return_value = True
+    summarizer.get_cropped_path.return_value = None
+    summarizer.summarize_session.return_value = (
+        "summary", 10, "prompt", [1], "explanation", ["#coding"], 0.9
+    )
+    worker._summarizer = summarizer
+    cfg = config_manager.config.summarization
+    worker._summarizer_key = (cfg.model, cfg.ollama_host)
+    return summarizer
+
+
+def _drain(worker):
+    """Return all tasks currently in the worker's pending queue."""
+    tasks = list(worker._pending_tasks)
+    worker._pending_tasks.clear()
+    return tasks
+
+
+class TestForceSummarizePending:
+    """Test grouping of unsummarized screenshots into time slots."""
+
+    def test_groups_screenshots_into_slots(self, worker, storage):
+        """Screenshots are grouped into slots; back-to-back slots are merged."""
+        base = datetime(2025, 1, 6, 10, 0)
+        offsets = [0, 2, 14, 15, 29, 61]  # minutes after 10:00
+        storage.get_unsummarized_screenshots.return_value = [
+            {'id': i, 'timestamp': (base + timedelta(minutes=m)).timestamp()}
+            for i, m in enumerate(offsets)
+        ]
+        storage.get_session_intervals.return_value = [(base, None)]
+
+        assert worker.force_summarize_pending() == 2
+
+        ranges = [payload for _, payload in _drain(worker)]
+        assert ranges == [
+            (datetime(2025, 1, 6, 10, 0), datetime(2025, 1, 6, 10, 30)),
+            (datetime(2025, 1, 6, 11, 0), datetime(2025, 1, 6, 11, 15)),
+        ]
+
+    def test_skips_afk_slots(self, worker, storage):
+        """Slots with no active session are not queued."""
+        base = datetime(2025, 1, 6, 10, 0)
+        storage.get_unsummarized_screenshots.return_value = [
+            {'id': 1, 'timestamp': base.timestamp()},
+            {'id': 2, 'timestamp': (base + timedelta(minutes=20)).timestamp()},
+        ]
+        storage.get_session_intervals.return_value = [
+            (base - timedelta(minutes=5), base + timedelta(minutes=10)),
+        ]
+
+        assert worker.force_summarize_pending() == 1
+        assert _drain(worker) == [
+            ('summarize_range',
+             (datetime(2025, 1, 6, 10, 0), datetime(2025, 1, 6, 10, 15))),
+        ]
+
+    def test_afk_slot_breaks_merge(self, worker, storage):
+        """Active slots either side of an AFK slot stay separate ranges."""
+        base = datetime(2025, 1, 6, 10, 0)
+        storage.get_unsummarized_screenshots.return_value = [
+            {'id': i, 'timestamp': (base + timedelta(minutes=15 * i)).timestamp()}
+            for i in range(3)
+        ]
+        storage.get_session_intervals.return_value = [
+            (base, base + timedelta(minutes=12)),
+            (base + timedelta(minutes=5), base + timedelta(minutes=14)),
+            (base + timedelta(minutes=31), None),
+        ]
+
+        assert worker.force_summarize_pending() == 2
+        assert [payload for _, payload in _drain(worker)] == [
+            (datetime(2025, 1, 6, 10, 0), datetime(2025, 1, 6, 10, 15)),
+            (datetime(2025, 1, 6, 10, 30), datetime(2025, 1, 6, 10, 45)),
+        ]
+
+    def test_separate_sessions_not_merged(self, worker, storage):
+        """Adjacent slots from sessions split by a real AFK gap stay separate."""
+        base = datetime(2025, 1, 6, 10, 0)
+        storage.get_unsummarized_screenshots.return_value = [
+            {'id': i, 'timestamp': (base + timedelta(minutes=15 * i)).timestamp()}
+            for i in range(3)
+        ]
+        storage.get_session_intervals.return_value = [
+            (base, base + timedelta(minutes=20)),
+            # Restart fragment: a 30s gap is within the 60s merge gap
+            (base + timedelta(minutes=20, seconds=30), base + timedelta(minutes=25)),
+            # Back after a 5 minute AFK gap: a new logical session
+            (base + timedelta(minutes=30), None),
+        ]
+
+        assert worker.force_summarize_pending() == 2
+        assert [payload for _, payload in _drain(worker)] == [
+            (datetime(2025, 1, 6, 10, 0), datetime(2025, 1, 6, 10, 30)),
+            (datetime(2025, 1, 6, 10, 30), datetime(2025, 1, 6, 10, 45)),
+        ]
+
+    def test_long_session_is_split(self, worker, storage):
+        """A long continuous session is queued in capped ranges."""
+        base = datetime(2025, 1, 6, 8, 0)
+        storage.get_unsummarized_screenshots.return_value = [
+            {'id': i, 'timestamp': (base + timedelta(minutes=15 * i)).timestamp()}
+            for i in range(20)  # five hours of 15-minute slots
+        ]
+        storage.get_session_intervals.return_value = [(base, None)]
+
+        assert worker.force_summarize_pending() == 3
+        assert [payload for _, payload in _drain(worker)] == [
+            (datetime(2025, 1, 6, 8, 0), datetime(2025, 1, 6, 10, 0)),
+            (datetime(2025, 1, 6, 10, 0), datetime(2025, 1, 6, 12, 0)),
+            (datetime(2025, 1, 6, 12, 0), datetime(2025, 1, 6, 13, 0)),
+        ]
+
+    def test_nothing_to_do(self, worker, storage):
+        """Returns 0 when there are no unsummarized screenshots."""
+        storage.get_unsummarized_screenshots.return_value = []
+        assert worker.force_summarize_pending() == 0
+        assert _drain(worker) == []
+
+    def test_stops_queueing_when_queue_full(self, worker, storage, monkeypatch):
+        """Only as many slots as fit in the bounded queue are reported."""
+        monkeypatch.setattr(summarizer_worker, "_MAX_PENDING_TASKS", 2)
+        base = datetime(2025, 1, 6, 10, 0)
+        storage.get_unsummarized_screenshots.return_value = [
+            {'id': i, 'timestamp': (base + timedelta(minutes=30 * i)).timestamp()}
+            for i in range(4)
+        ]
+        storage.get_session_intervals.return_value = [(base, None)]
+
+        assert worker.force_summarize_pending() == 2
+        assert len(_drain(worker)) == 2
+
+
+class TestScheduleSlot:
+    """Test rounding timestamps down to schedule slots."""
+
+    @pytest.mark.parametrize("frequency, expected", [
+        (15, datetime(2025, 1, 6, 10, 45)),
+        (60, datetime(2025, 1, 6, 10, 0)),
+        (45, datetime(2025, 1, 6, 10, 30)),
+        (25, datetime(2025, 1, 6, 10, 50)),
+        (90, datetime(2025, 1, 6, 10, 30)),
+    ])
+    def test_rounds_down_to_slot(self, worker, frequency, expected):
+        """Slots align to midnight whether or not they divide the hour."""
+        dt = datetime(2025, 1, 6, 10, 52, 31, 1234)
+        assert worker._get_schedule_slot(dt, frequency) == expected
+
+
+class TestSummarizationConfig:
+    """Test the cached summarization settings snapshot."""
+
+    def test_snapshot_refreshed_on_config_change(self, worker, config_manager):
+        """The snapshot is reused until the config changes, then rebuilt."""
+        first = worker._summarization_config()
+        assert worker._summarization_config() is first
+        assert first is not config_manager.config.summarization
+
+        config_manager.update('summarization', 'max_samples', 3)
+
+        second = worker._summarization_config()
+        assert second is not first
+        assert second.max_samples == 3
+        assert first.max_samples == 10
+
+
+    def test_config_snapshot_dict_follows_settings(self, worker, config_manager):
+        """The stored config_snapshot dict is rebuilt only with the settings."""
+        cfg = worker._summarization_config()
+        snapshot = worker._config_snapshot_for(cfg)
+        assert worker._config_snapshot_for(cfg) is snapshot
+        assert snapshot['max_samples'] == 10
+
+        config_manager.update('summarization', 'max_samples', 3)
+
+        new_snapshot = worker._config_snapshot_for(worker._summarization_config())
+        assert new_snapshot['max_samples'] == 3
+        assert snapshot['max_samples'] == 10
+
+    def test_summarizer_rebuilt_on_host_change(self, worker, config_manager):
+        """Changing the Ollama host (not just the model) recreates the summarizer."""
+        first = worker.summarizer
+        assert worker.summarizer is first
+
+        config_manager.update('summarization', 'ollama_host', 'http://ollama:11434')
+
+        second = worker.summarizer
+        assert second is not first
+        assert second.ollama_host == 'http://ollama:11434'
+        worker._http_session.close()
+
+
+class TestNextWakeup:
+    """Test the run loop's idle wakeup deadline."""
+
+    def test_idle_wakes_at_midnight(self, worker):
+        """With no active session the next check is the daily boundary."""
+        cfg = worker._summarization_config()
+        now = datetime(2025, 1, 8, 14, 30)  # Wednesday
+        assert worker._next_wakeup(now, cfg) == datetime(2025, 1, 9, 0, 0)
+
+    def test_weekly_and_monthly_boundaries(self, worker):
+        """Just after midnight, the weekly/monthly offsets come first."""
+        cfg = worker._summarization_config()
+        sunday = datetime(2025, 1, 12, 0, 1)
+        assert worker._next_wakeup(sunday, cfg) == datetime(2025, 1, 12, 0, 5)
+        first = datetime(2025, 2, 1, 0, 2)
+        assert worker._next_wakeup(first, cfg) == datetime(2025, 2, 1, 0, 10)
+
+    def test_preview_due(self, worker):
+        """An active session wakes the loop for its next preview."""
+        cfg = worker._summarization_config()
+        worker._next_preview_eligible = datetime(2025, 1, 8, 14, 15)
+        now = datetime(2025, 1, 8, 14, 1)
+        assert worker._next_wakeup(now, cfg) == datetime(2025, 1, 8, 14, 15)
+
+
+class TestPreviewSchedule:
+    """Test when preview summaries are attempted."""
+
+    def test_first_preview_waits_for_session_warmup(self, worker, monkeypatch):
+        """No preview is attempted until the session has run one interval."""
+        generate = Mock()
+        monkeypatch.setattr(worker, "_generate_preview_summary", generate)
+        cfg = worker._summarization_config()
+
+        worker.notify_session_start(1)
+        start = worker._current_session_start
+        assert worker._next_preview_eligible == start + timedelta(minutes=15)
+
+        worker._maybe_generate_preview(start + timedelta(minutes=14), cfg)
+        generate.assert_not_called()
+
+        worker._maybe_generate_preview(start + timedelta(minutes=15), cfg)
+        generate.assert_called_once()
+
+
+class TestHttpSession:
+    """Test the pooled HTTP session shared by summarizers."""
+
+    def test_reused_until_host_changes(self, worker):
+        """The same session is returned for a host until the host changes."""
+        first = worker._get_http_session("http://localhost:11434")
+        assert worker._get_http_session("http://localhost:11434") is first
+
+        second = worker._get_http_session("http://ollama:11434")
+        assert second is not first
+        second.close()
+
+
+class TestReportGenerator:
+    """Test the shared ReportGenerator."""
+
+    def test_reused_until_summarizer_changes(self, worker, summarizer):
+        """One generator serves all report paths until the summarizer is replaced."""
+        first = worker._get_report_generator()
+        assert first.summarizer is summarizer
+        assert worker._get_report_generator() is first
+
+        worker._summarizer = Mock()
+        second = worker._get_report_generator()
+        assert second is not first
+        assert second.summarizer is worker._summarizer
+
+
+class TestNextTask:
+    """Test the run loop's task wait."""
+
+    def test_returns_queued_task(self, worker):
+        """A queued task is returned without waiting for the timeout."""
+        worker._running = True
+        worker.queue_regenerate(5)
+        assert worker._next_task(timeout=5) == ('regenerate', 5)
+
+    def test_wake_ends_wait_without_task(self, worker):
+        """_wake() ends the wait early and yields no task."""
+        worker._running = True
+        worker._wake()
+        assert worker._next_task(timeout=5) is None
+        assert not worker._wake_requested
+
+
+class TestQueueDedup:
+    """Test that repeated requests for the same ID are queued once."""
+
+    def test_regenerate_queued_once(self, worker):
+        """A second regenerate for a waiting summary is ignored."""
+        worker.queue_regenerate(7)
+        worker.queue_regenerate(7)
+        worker.queue_regenerate(8)
+        assert _drain(worker) == [('regenerate', 7), ('regenerate', 8)]
+
+        # Once dequeued, the summary can be queued again
+        worker._mark_dequeued('regenerate', 7)
+        worker.queue_regenerate(7)
+        assert _drain(worker) == [('regenerate', 7)]
+
+    def test_enqueue_unique_status(self, worker, monkeypatch):
+        """Duplicates and a full queue are reported as distinct outcomes."""
+        monkeypatch.setattr(summarizer_worker, "_MAX_PENDING_TASKS", 1)
+        pending = worker._regenerate_pending
+        Result = summarizer_worker._EnqueueResult
+
+        assert worker._enqueue_unique(('regenerate', 1), 1, pending) is Result.QUEUED
+        assert worker._enqueue_unique(('regenerate', 1), 1, pending) is Result.DUPLICATE
+        assert worker._enqueue_unique(('regenerate', 2), 2, pending) is Result.FULL
+        assert pending == {1}
+
+    def test_session_end_queued_once(self, worker):
+        """A second session_end for a waiting session is ignored."""
+        worker.queue_session_end(3)
+        worker.queue_session_end(3)
+        tasks = _drain(worker)
+        assert [(t, payload[0]) for t, payload in tasks] == [('session_end', 3)]
+
+    def test_force_summarize_skips_waiting_sessions(self, worker, storage, monkeypatch):
+        """Forced sessions share the session_end dedup with AFK-queued ones."""
+        storage.get_sessions_without_summaries.return_value = [
+            {'id': i, 'start_time': '2025-01-06T10:00:00', 'end_time': '2025-01-06T11:00:00'}
+            for i in (3, 4, 5)
+        ]
+        worker.queue_session_end(3)
+
+        assert worker.force_summarize_sessions() == 2
+        assert worker.force_summarize_sessions() == 0
+        worker.queue_session_end(4)
+        tasks = _drain(worker)
+        assert [payload[0] for _, payload in tasks] == [3, 4, 5]
+
+        # A full queue still stops the loop
+        worker._mark_dequeued('session_end', (3, None))
+        worker._mark_dequeued('session_end', (4, None))
+        worker._mark_dequeued('session_end', (5, None))
+        monkeypatch.setattr(summarizer_worker, "_MAX_PENDING_TASKS", 1)
+        assert worker.force_summarize_sessions() == 1
+        assert [payload[0] for _, payload in _drain(worker)] == [3]
+
+
+class TestSummarizeTimeRange:
+    """Test the primary time-range summarization path."""
+
+    def test_low_focus_skips_without_building_summarizer(self, worker, storage):
+        """Ranges below min_focus_seconds never construct the summarizer."""
+        storage.get_time_range_status.return_value = (False, True)
+        storage.get_screenshots_in_range.return_value = [{'id': 1, 'timestamp': 0.0}]
+        storage.get_focus_events_clipped_to_range.return_value = [
+            {'start_time': '2025-01-06T10:00:00', 'end_time': '2025-01-06T10:00:10',
+             'duration_seconds': 10},
+        ]
+
+        worker._do_summarize_time_range(
+            datetime(2025, 1, 6, 10, 0), datetime(2025, 1, 6, 10, 15)
+        )
+
+        assert worker._summarizer is None
+        storage.save_threshold_summary.assert_not_called()
+
+
+    def test_previous_summary_cached_across_ranges(self, worker, storage, summarizer):
+        """Back-to-back ranges reuse the last saved summary as context."""
+        storage.get_time_range_status.return_value = (False, True)
+        storage.get_screenshots_in_range.return_value = []
+        storage.get_focus_events_clipped_to_range.return_value = [
+            {'start_time': '2025-01-06T09:00:00', 'end_time': '2025-01-06T12:00:00',
+             'duration_seconds': 10800},
+        ]
+        storage.get_last_threshold_summary.return_value = {
+            'end_time': '2025-01-06T09:45:00', 'summary': 'older'
+        }
+        summarizer.summarize_session.side_effect = [
+            ("first", 10, "prompt", [], "", [], 0.9),
+            ("second", 10, "prompt", [], "", [], 0.9),
+        ]
+
+        worker._do_summarize_time_range(datetime(2025, 1, 6, 10, 0), datetime(2025, 1, 6, 10, 15))
+        worker._do_summarize_time_range(datetime(2025, 1, 6, 10, 15), datetime(2025, 1, 6, 10, 30))
+
+        storage.get_last_threshold_summary.assert_called_once()
+        previous = [c.kwargs['previous_summary'] for c in summarizer.summarize_session.call_args_list]
+        assert previous == ['older', 'first']
+
+    def test_regenerate_refreshes_previous_summary(self, worker, storage, summarizer, monkeypatch):
+        """A summary regenerated between two ranges is re-read as context."""
+        storage.get_time_range_status.return_value = (False, True)
+        storage.get_screenshots_in_range.return_value = []
+        storage.get_focus_events_clipped_to_range.return_value = [
+            {'start_time': '2025-01-06T09:00:00', 'end_time': '2025-01-06T12:00:00',
+             'duration_seconds': 10800},
+        ]
+        storage.get_last_threshold_summary.return_value = {
+            'end_time': '2025-01-06T09:45:00', 'summary': 'older'
+        }
+        storage.get_threshold_summary.return_value = {'screenshot_ids': [1]}
+        storage.get_screenshots_by_ids.return_value = [{'id': 1, 'timestamp': 0.0}]
+        monkeypatch.setattr(worker, '_gather_ocr', lambda screenshots: [])
+        monkeypatch.setattr(worker, '_gather_focus_events', lambda screenshots: [])
+        summarizer.summarize_session.side_effect = [
+            ("first", 10, "prompt", [], "", [], 0.9),
+            ("rewritten", 10, "prompt", [], "", [], 0.9),
+            ("second", 10, "prompt", [], "", [], 0.9),
+        ]
+        worker._running = True
+
+        worker._do_summarize_time_range(datetime(2025, 1, 6, 10, 0), datetime(2025, 1, 6, 10, 15))
+        worker.queue_regenerate(42)
+        # Another task reloads the cache before the regenerate runs
+        storage.get_last_threshold_summary.return_value = {
+            'end_time': '2025-01-06T10:15:00', 'summary': 'first'
+        }
+        assert worker._get_previous_summary() == 'first'
+        storage.get_last_threshold_summary.return_value = {
+            'end_time': '2025-01-06T10:15:00', 'summary': 'rewritten'
+        }
+        task_type, summary_id = worker._next_task(timeout=0)
+        worker._do_regenerate(summary_id)
+        worker._do_summarize_time_range(datetime(2025, 1, 6, 10, 15), datetime(2025, 1, 6, 10, 30))
+
+        previous = [c.kwargs['previous_summary'] for c in summarizer.summarize_session.call_args_list]
+        assert previous == ['older', None, 'rewritten']
+
+
+class TestCheckUnsummarizedSessions:
+    """Test startup recovery of sessions without summaries."""
+
+    @pytest.mark.parametrize("parallelism", [1, 3])
+    def test_recovers_every_session(self, worker, storage, config_manager, monkeypatch, parallelism):
+        """Each unsummarized session is summarized, serially or in parallel."""
+        config_manager.update('summarization', 'recovery_parallelism', parallelism)
+        storage.get_sessions_without_summaries.return_value = [
+            {'id': i, 'start_time': f'2025-01-06T1{i}:00:00', 'end_time': f'2025-01-06T1{i}:30:00'}
+            for i in range(4)
+        ]
+        summarize = Mock(side_effect=[None, RuntimeError("boom"), None, None])
+        monkeypatch.setattr(worker, "_do_summarize_time_range", summarize)
+
+        worker._check_unsummarized_sessions()
+
+        assert sorted(c.args[0].hour for c in summarize.call_args_list) == [10, 11, 12, 13]
+
+
+class TestSummarizeScreenshots:
+    """Test the legacy screenshot-batch summarization path."""
+
+    @pytest.mark.parametrize("fast_single_shot, expected_range", [
+        (False, (datetime(2025, 1, 6, 10, 7, 30), datetime(2025, 1, 6, 10, 7, 30))),
+        (True, (datetime(2025, 1, 6, 10, 0), datetime(2025, 1, 6, 10, 15))),
+    ])
+    def test_single_screenshot_focus_range(
+        self, worker, storage, summarizer, config_manager, fast_single_shot, expected_range
+    ):
+        """A lone screenshot's focus window is only widened when opted in."""
+        config_manager.update('summarization', 'fast_single_shot', fast_single_shot)
+        ts = datetime(2025, 1, 6, 10, 7, 30).timestamp()
+        storage.get_focus_events_clipped_to_range.return_value = []
+        storage.get_last_threshold_summary.return_value = None
+
+        worker._do_summarize_screenshots([{'id': 1, 'timestamp': ts}])
+
+        assert storage.get_focus_events_clipped_to_range.call_args[0] == expected_range
+        storage.save_threshold_summary.assert_called_once()
+
+    def test_skips_unused_focus_and_ocr(self, worker, storage, summarizer, config_manager):
+        """Focus events and OCR are not gathered when nothing would use them."""
+        config_manager.update('summarization', 'include_focus_context', False)
+        config_manager.update('summarization', 'focus_weighted_sampling', False)
+        config_manager.update('summarization', 'include_ocr', False)
+        storage.get_last_threshold_summary.return_value = None
+
+        worker._do_summarize_screenshots([{'id': 1, 'timestamp': 0.0}])
+
+        storage.get_focus_events_clipped_to_range.assert_not_called()
+        summarizer.extract_ocr.assert_not_called()
+        assert summarizer.summarize_session.call_args.kwargs['focus_events'] == []
+
+
+class TestGatherOcr:
+    """Test OCR gathering for unique window titles."""
+
+    @pytest.fixture(autouse=True)
+    def screenshot_files(self, config_manager, tmp_path):
+        """Point data_dir at tmp_path and create screenshots a.webp..d.webp."""
+        config_manager.update('storage', 'data_dir', str(tmp_path))
+        screenshots_dir = tmp_path / "screenshots"
+        screenshots_dir.mkdir()
+        for name in ('a', 'b', 'c', 'd'):
+            (screenshots_dir / f"{name}.webp").touch()
+
+    def test_one_ocr_per_title_in_order(self, worker, summarizer):
+        """Each title is OCR'd once; results keep first-seen order."""
+        def extract_ocr(path):
+            if path.endswith('b.webp'):
+                raise RuntimeError("tesseract failed")
+            return f"text of {os.path.basename(path)}"
+
+        summarizer.extract_ocr.side_effect = extract_ocr
+        screenshots = [
+            {'id': 1, 'filepath': 'a.webp', 'window_title': 'Editor'},
+            {'id': 2, 'filepath': 'b.webp', 'window_title': 'Browser'},
+            {'id': 3, 'filepath': 'c.webp', 'window_title': 'Editor'},
+            {'id': 4, 'filepath': 'd.webp', 'window_title': 'Terminal'},
+            {'id': 5, 'filepath': 'e.webp', 'window_title': None},
+        ]
+
+        ocr_texts = worker._gather_ocr(screenshots)
+
+        assert ocr_texts == [
+            {'window_title': 'Editor', 'ocr_text': 'text of a.webp'},
+            {'window_title': 'Terminal', 'ocr_text': 'text of d.webp'},
+        ]
+        assert summarizer.extract_ocr.call_count == 3
+
+    def test_modified_markers_share_one_ocr(self, worker, summarizer):
+        """Titles differing only by an unsaved marker are OCR'd once."""
+        summarizer.extract_ocr.side_effect = lambda path: os.path.basename(path)
+        screenshots = [
+            {'id': 1, 'filepath': 'a.webp', 'window_title': 'notes.txt - gedit'},
+            {'id': 2, 'filepath': 'b.webp', 'window_title': '*notes.txt - gedit'},
+            {'id': 3, 'filepath': 'c.webp', 'window_title': '● main.py - Code'},
+            {'id': 4, 'filepath': 'd.webp', 'window_title': 'main.py - Code'},
+        ]
+
+        ocr_texts = worker._gather_ocr(screenshots)
+
+        assert ocr_texts == [
+            {'window_title': 'notes.txt - gedit', 'ocr_text': 'a.webp'},
+            {'window_title': '● main.py - Code', 'ocr_text': 'c.webp'},
+        ]
+
+    def test_missing_file_skips_ocr(self, worker, summarizer):
+        """Screenshots whose file is gone are never handed to Tesseract."""
+        summarizer.extract_ocr.return_value = 'text'
+        screenshots = [
+            {'id': 1, 'filepath': 'gone.webp', 'window_title': 'Editor'},
+            {'id': 2, 'filepath': 'b.webp', 'window_title': 'Browser'},
+        ]
+
+        ocr_texts = worker._gather_ocr(screenshots)
+
+        assert ocr_texts == [{'window_title': 'Browser', 'ocr_text': 'text'}]
+        summarizer.extract_ocr.assert_called_once()
+
+    def test_cached_text_skips_ocr(self, worker, storage, summarizer):
+        """Cached screenshots are not re-OCR'd; new non-empty text is saved."""
+        storage.get_ocr_texts.return_value = {1: 'cached editor text'}
+        summarizer.extract_ocr.side_effect = (
+            lambda path: '' if path.endswith('c.webp') else 'fresh text'
+        )
+        screenshots = [
+            {'id': 1, 'filepath': 'a.webp', 'window_title': 'Editor'},
+            {'id': 2, 'filepath': 'b.webp', 'window_title': 'Browser'},
+            {'id': 3, 'filepath': 'c.webp', 'window_title': 'Terminal'},
+        ]
+
+        ocr_texts = worker._gather_ocr(screenshots)
+
+        assert ocr_texts == [
+            {'window_title': 'Editor', 'ocr_text': 'cached editor text'},
+            {'window_title': 'Browser', 'ocr_text': 'fresh text'},
+            {'window_title': 'Terminal', 'ocr_text': ''},
+        ]
+        assert summarizer.extract_ocr.call_count == 2
+        storage.get_ocr_texts.assert_called_once_with([1, 2, 3], False)
+        storage.save_ocr_texts.assert_any_call({2: 'fresh text'}, False)
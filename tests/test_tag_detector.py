@@ -0,0 +1,160 @@
+"""Tests for activity tag detection."""
+
+import re
+
+import pytest
+
+from tracker import tag_detector
+from tracker.tag_detector import (
+    DEFAULT_TAG,
+    TAG_RULES,
+    TagRule,
+    DEFAULT_TAG_COLOR,
+    detect_tag,
+    get_all_tags,
+    get_tag_breakdown,
+    get_tag_color,
+    get_tag_colors,
+)
+
+
+def _reference_detect_tag(app_name, window_title):
+    """Straightforward rule walk that detect_tag must stay equivalent to."""
+    if not app_name and not window_title:
+        return DEFAULT_TAG
+    app_lower = (app_name or '').lower()
+    window_lower = (window_title or '').lower()
+    for tag, rule in TAG_RULES.items():
+        if tag in ('#browsing', '#terminal'):
+            continue
+        if any(re.search(p, window_lower, re.IGNORECASE) for p in rule.windows):
+            return tag
+        if any(a.lower() in app_lower for a in rule.apps):
+            return tag
+    for tag in ('#terminal', '#browsing'):
+        if any(a.lower() in app_lower for a in TAG_RULES[tag].apps):
+            return tag
+    return DEFAULT_TAG
+
+
+SAMPLES = [
+    ('Code', 'reports.py - activity-tracker - Visual Studio Code'),
+    ('code', 'README.md - activity-tracker - Visual Studio Code'),
+    ('Firefox', 'python - Stack Overflow — Mozilla Firefox'),
+    ('Google-chrome', 'Inbox (3) - Gmail - Google Chrome'),
+    ('Slack', 'general - Team - Slack'),
+    ('Slack', 'github.com/org/repo - Slack'),  # earlier rule's window wins
+    ('zoom', 'Zoom Meeting'),
+    ('Microsoft Teams', 'Call with Alex | Microsoft Teams'),
+    ('obsidian', 'notes.md - vault - Obsidian'),
+    ('gnome-terminal', 'user@host: ~/src'),
+    ('Alacritty', 'vim main.rs'),
+    ('Spotify', 'Spotify Premium'),
+    ('Brave-browser', 'Some shop - Brave'),
+    ('Chromium', 'YouTube - youtube.com'),
+    ('PyCharm', '[Debug] server'),
+    ('Nautilus', 'Downloads'),
+    ('', 'Weekly standup notes'),
+    (None, None),
+    ('', ''),
+]
+
+
+class TestDetectTag:
+    """Test tag classification from app and window patterns."""
+
+    @pytest.mark.parametrize("app_name, window_title", SAMPLES)
+    def test_matches_reference_rule_walk(self, app_name, window_title):
+        """Precompiled detection agrees with walking TAG_RULES directly."""
+        assert detect_tag(app_name, window_title) == _reference_detect_tag(
+            app_name, window_title
+        )
+
+    def test_repeated_pairs_are_memoized(self):
+        """Case variants of the same pair share one cached classification."""
+        tag_detector._detect_tag_lower.cache_clear()
+        assert detect_tag('Code', 'main.py') == '#coding'
+        assert detect_tag('code', 'MAIN.PY') == '#coding'
+        info = tag_detector._detect_tag_lower.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_rule_compiles_its_patterns(self):
+        """TagRule precompiles window patterns and lowercases app keywords."""
+        rule = TagRule(apps=['Zed'], windows=[r'\.py\b', r'\[Debug\]'], color='#000')
+        assert rule.lower_apps == ('zed',)
+        assert rule.window_re.search('[debug] main')
+        assert not rule.window_re.search('main.pyc')
+        assert TagRule(apps=[], windows=[], color='#000').window_re is None
+
+    def test_priority_order(self):
+        """Content rules beat app fallbacks, and earlier rules win."""
+        assert detect_tag('firefox', 'main.py - GitHub') == '#coding'
+        assert detect_tag('slack', 'github.com pull request') == '#research'
+        assert detect_tag('firefox', 'Online shop') == '#browsing'
+        assert detect_tag('nautilus', 'Downloads') == DEFAULT_TAG
+
+
+class TestTagColors:
+    """Test tag listing and color lookups."""
+
+    def test_colors_and_tags_cover_default(self):
+        """Every rule tag plus the default tag has a color, in priority order."""
+        assert get_all_tags() == list(TAG_RULES) + [DEFAULT_TAG]
+        assert get_tag_colors() == {
+            **{tag: rule.color for tag, rule in TAG_RULES.items()},
+            DEFAULT_TAG: DEFAULT_TAG_COLOR,
+        }
+        assert get_tag_color('#coding') == TAG_RULES['#coding'].color
+        assert get_tag_color('#unknown') == DEFAULT_TAG_COLOR
+
+    def test_returned_collections_are_copies(self):
+        """Callers can't mutate the module's lookup tables."""
+        get_tag_colors()['#coding'] = 'red'
+        get_all_tags().append('#extra')
+        assert get_tag_color('#coding') == TAG_RULES['#coding'].color
+        assert '#extra' not in get_all_tags()
+
+
+class TestTagBreakdown:
+    """Test aggregation of focus time by tag."""
+
+    def test_breakdown_totals_and_windows(self):
+        """Time is summed per tag and per window, sorted descending."""
+        events = [
+            {'app_name': 'code', 'window_title': 'a.py', 'duration_seconds': 60},
+            {'app_name': 'code', 'window_title': 'b.py', 'duration_seconds': 120},
+            {'app_name': 'code', 'window_title': 'a.py', 'duration_seconds': 90},
+            {'app_name': 'slack', 'window_title': 'general', 'duration_seconds': 30},
+            {'app_name': 'nautilus', 'window_title': 'Home', 'duration_seconds': None},
+        ]
+
+        breakdown = get_tag_breakdown(events)
+
+        assert [b.tag for b in breakdown] == ['#coding', '#communication', DEFAULT_TAG]
+        coding = breakdown[0]
+        assert coding.total_seconds == 270
+        assert coding.percentage == pytest.approx(90.0)
+        assert coding.windows == [
+            {'app_name': 'code', 'window_title': 'a.py', 'duration_seconds': 150},
+            {'app_name': 'code', 'window_title': 'b.py', 'duration_seconds': 120},
+        ]
+        assert breakdown[2].total_seconds == 0
+
+    def test_top_ten_windows(self):
+        """Only the ten longest windows are listed; ties keep first-seen order."""
+        events = [
+            {'app_name': 'code', 'window_title': f'{i}.py', 'duration_seconds': 10 + i // 2}
+            for i in range(15)
+        ]
+
+        coding = get_tag_breakdown(events)[0]
+
+        assert coding.total_seconds == sum(e['duration_seconds'] for e in events)
+        assert [w['window_title'] for w in coding.windows] == [
+            '14.py', '12.py', '13.py', '10.py', '11.py',
+            '8.py', '9.py', '6.py', '7.py', '4.py',
+        ]
+
+    def test_no_focus_time(self):
+        """No breakdown is produced when there is no tracked time."""
+        assert get_tag_breakdown([]) == []
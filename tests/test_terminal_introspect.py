@@ -0,0 +1,104 @@
+"""Tests for terminal process introspection via /proc."""
+
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+from tracker import terminal_introspect
+from tracker.terminal_introspect import (
+    _ProcSnapshot,
+    _any_shell_in_tmux,
+    _check_ssh_in_tree,
+    _find_foreground_process,
+    _find_shell_in_ancestry,
+    _get_descendant_pids,
+)
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith('linux'), reason="requires /proc"
+)
+
+
+@pytest.fixture
+def shell_with_child():
+    """A running `sh` whose only child is a `sleep`."""
+    # The trailing `:` stops sh from exec'ing sleep in place of itself
+    proc = subprocess.Popen(['sh', '-c', 'sleep 30; :'])
+    for _ in range(100):
+        children = _get_descendant_pids(proc.pid)
+        if children and _ProcSnapshot().comm(children[0]) == 'sleep':
+            break
+        time.sleep(0.01)
+    else:
+        proc.kill()
+        pytest.skip("sleep child did not start")
+    yield proc.pid, children[0]
+    os.kill(children[0], signal.SIGKILL)
+    proc.wait()
+
+
+class TestProcSnapshot:
+    """Test the per-call /proc read cache."""
+
+    def test_reads_live_process(self, shell_with_child):
+        """comm and ppid come from /proc for running processes."""
+        shell_pid, sleep_pid = shell_with_child
+        snapshot = _ProcSnapshot()
+        assert snapshot.comm(shell_pid) == 'sh'
+        assert snapshot.comm(sleep_pid) == 'sleep'
+        assert snapshot.ppid(sleep_pid) == shell_pid
+
+    def test_missing_process(self):
+        """Unreadable PIDs are reported as None rather than raising."""
+        snapshot = _ProcSnapshot()
+        assert snapshot.comm(2 ** 30) is None
+        assert snapshot.ppid(2 ** 30) is None
+
+    def test_helpers_share_reads(self, shell_with_child, monkeypatch):
+        """Helpers given the same snapshot agree and read /proc once per PID."""
+        shell_pid, sleep_pid = shell_with_child
+        tmux_checks = []
+        monkeypatch.setattr(
+            terminal_introspect, '_process_in_tmux',
+            lambda pid: tmux_checks.append(pid) or False,
+        )
+        snapshot = _ProcSnapshot()
+        pids = [shell_pid, sleep_pid]
+
+        assert _find_foreground_process(pids, snapshot) == sleep_pid
+        assert _find_shell_in_ancestry(sleep_pid, snapshot) == 'sh'
+        assert not _check_ssh_in_tree(pids, snapshot)
+        assert not _any_shell_in_tmux(pids, snapshot)
+        assert not _any_shell_in_tmux(pids, snapshot)
+
+        assert tmux_checks == [shell_pid]
+        assert set(snapshot._comms) == {shell_pid, sleep_pid}
+
+
+class TestReadSmall:
+    """Test raw reads of /proc files."""
+
+    def test_reads_whole_file(self, tmp_path):
+        """Files longer than one read chunk are returned in full."""
+        path = tmp_path / 'environ'
+        data = b'\x00'.join(b'VAR%d=%s' % (i, b'x' * 100) for i in range(100))
+        path.write_bytes(data)
+        assert terminal_introspect._read_small(str(path)) == data
+
+    def test_missing_file(self, tmp_path):
+        """A file that can't be opened reads as None."""
+        assert terminal_introspect._read_small(str(tmp_path / 'gone')) is None
+
+    def test_process_in_tmux(self, tmp_path, monkeypatch):
+        """TMUX is found past the first 4 KiB of the environment."""
+        environ = tmp_path / 'environ'
+        environ.write_bytes(b'PAD=' + b'x' * 5000 + b'\x00TMUX=/tmp/tmux-1000/default\x00')
+        read_small = terminal_introspect._read_small
+        monkeypatch.setattr(
+            terminal_introspect, '_read_small', lambda path: read_small(str(environ))
+        )
+        assert terminal_introspect._process_in_tmux(1234)
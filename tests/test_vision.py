@@ -0,0 +1,51 @@
+"""Tests for the HybridSummarizer's Ollama availability check."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from tracker import vision
+from tracker.vision import HybridSummarizer
+
+
+@pytest.fixture
+def http():
+    """Mock HTTP session whose /api/tags lists the summarizer's model."""
+    http = Mock()
+    http.get.return_value.json.return_value = {"models": [{"name": "gemma3:14b"}]}
+    return http
+
+
+@pytest.fixture
+def summarizer(http, monkeypatch):
+    """HybridSummarizer with Tesseract present and a mocked HTTP session."""
+    monkeypatch.setattr(vision.shutil, "which", lambda name: "/usr/bin/" + name)
+    return HybridSummarizer(model="gemma3:14b", http_session=http)
+
+
+class TestIsAvailable:
+    """Test caching of the availability probe."""
+
+    def test_success_is_cached(self, summarizer, http):
+        """Back-to-back checks probe Ollama only once."""
+        assert summarizer.is_available()
+        assert summarizer.is_available()
+        assert http.get.call_count == 1
+
+    def test_failed_call_drops_cache(self, summarizer, http):
+        """A failed Ollama call forces the next check to probe again."""
+        assert summarizer.is_available()
+        http.post.side_effect = ConnectionError("refused")
+
+        with pytest.raises(RuntimeError):
+            summarizer.generate_text("hello")
+
+        assert summarizer.is_available()
+        assert http.get.call_count == 2
+
+    def test_failure_is_not_cached(self, summarizer, http):
+        """An unavailable result is re-checked on the next call."""
+        http.get.return_value.json.return_value = {"models": []}
+        assert not summarizer.is_available()
+        assert not summarizer.is_available()
+        assert http.get.call_count == 2
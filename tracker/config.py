@@ -101,6 +101,12 @@ class SummarizationConfig:
         max_samples: Set by quality_preset (max screenshots to LLM)
         include_previous_summary: Set by quality_preset (context continuity)
         focus_weighted_sampling: Set by quality_preset (weight by focus time)
+        fast_single_shot: Widen the focus-event window around single-screenshot
+            batches by half a slot either side instead of querying a
+            zero-width range (default: False)
+        recovery_parallelism: Sessions summarized, and missing daily reports
+            generated, concurrently during startup recovery; 1 keeps
+            recovery serial (default: 1)
 
     Deprecated (kept for backward compatibility):
         frequency_minutes: Legacy periodic interval (default: 15, deprecated)
@@ -130,6 +136,8 @@ class SummarizationConfig:
     max_samples: int = 10                # Set by preset: quick=5, balanced=10, thorough=15
     include_previous_summary: bool = True  # Set by preset: quick=False, balanced/thorough=True
     focus_weighted_sampling: bool = True   # Set by preset: quick=False, balanced/thorough=True
+    fast_single_shot: bool = False         # Single-screenshot batches use a +/- half-slot focus window
+    recovery_parallelism: int = 1          # Concurrent startup-recovery summaries (Ollama must allow parallel requests)
 
     # Deprecated settings (kept for backward compatibility with force_summarize_pending)
     frequency_minutes: int = 15  # DEPRECATED: Used only for legacy force_summarize
@@ -261,6 +269,7 @@ class ConfigManager:
         DEFAULT_PATH: Default configuration file location
         path: Actual configuration file path being used
         config: Current configuration object
+        version: Counter bumped whenever the configuration may have changed
 
     Example:
         >>> config_mgr = ConfigManager()
@@ -280,8 +289,28 @@ class ConfigManager:
             path: Custom config file path (uses DEFAULT_PATH if None)
         """
         self.path = Path(path).expanduser() if path else self.DEFAULT_PATH
+        self._version = 0
         self.config = self._load()
 
+    @property
+    def config(self) -> Config:
+        """Current configuration object."""
+        return self._config
+
+    @config.setter
+    def config(self, value: Config) -> None:
+        self._config = value
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every reload, replacement, or save.
+
+        Lets consumers cache values derived from the configuration and
+        rebuild them only when this number changes.
+        """
+        return self._version
+
     def _load(self) -> Config:
         """Load configuration from YAML file.
 
@@ -360,6 +389,8 @@ class ConfigManager:
         Raises:
             OSError: If file write fails
         """
+        # Saving is the commit point for in-place edits to config sections
+        self._version += 1
         try:
             self.path.parent.mkdir(parents=True, exist_ok=True)
             with open(self.path, 'w') as f:
@@ -21,6 +21,7 @@ Example:
     >>> print(report.executive_summary)
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, TYPE_CHECKING
@@ -1326,11 +1327,15 @@ TAGS: Comma-separated activity tags (e.g., coding, research, meetings)"""
         summary = '\n'.join(summary_lines).strip()
         return summary, explanation, confidence, tags
 
-    def generate_missing_daily_reports(self, days_back: int = 7) -> int:
+    def generate_missing_daily_reports(self, days_back: int = 7, max_workers: int = 1) -> int:
         """Generate cached daily reports for recent days that are missing.
 
+        Days are independent of each other, so with max_workers > 1 they are
+        generated concurrently (the LLM backend must accept parallel requests).
+
         Args:
             days_back: How many days to look back.
+            max_workers: Maximum number of days to generate at once.
 
         Returns:
             Number of reports generated.
@@ -1341,13 +1346,14 @@ TAGS: Comma-separated activity tags (e.g., coding, research, meetings)"""
             return 0
 
         logger.info(f"Generating {len(missing_dates)} missing daily reports")
-        count = 0
-        for date_str in missing_dates:
-            result = self.generate_daily_report(date_str)
-            if result:
-                count += 1
+        workers = min(max_workers, len(missing_dates))
+        if workers <= 1:
+            results = [self.generate_daily_report(date_str) for date_str in missing_dates]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="daily-report") as pool:
+                results = list(pool.map(self.generate_daily_report, missing_dates))
 
-        return count
+        return sum(1 for result in results if result)
 
     def generate_weekly_report(
         self,
@@ -42,7 +42,7 @@ import sqlite3
 import os
 from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -69,7 +69,10 @@ class ActivityStorage:
         >>> # Query by time range
         >>> screenshots = storage.get_screenshots(start_ts, end_ts)
     """
-    
+
+    # Max bound parameters per statement (SQLite's historical default is 999)
+    MAX_QUERY_PARAMS = 900
+
     def __init__(self, db_path: str = None):
         """Initialize ActivityStorage with database connection.
         
@@ -123,6 +126,8 @@ class ActivityStorage:
         try:
             conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row
+            # Safe with WAL (set in init_db): commits skip the per-write fsync
+            conn.execute("PRAGMA synchronous=NORMAL")
             try:
                 yield conn
             finally:
@@ -147,6 +152,10 @@ class ActivityStorage:
             RuntimeError: If database access fails
         """
         with self.get_connection() as conn:
+            # WAL persists in the database file; it lets the web server read
+            # while the daemon writes and makes each commit a single append.
+            conn.execute("PRAGMA journal_mode=WAL")
+
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS screenshots (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -282,6 +291,17 @@ class ActivityStorage:
                 CREATE INDEX IF NOT EXISTS idx_ocr_session ON session_ocr_cache(session_id)
             """)
 
+            # Per-screenshot OCR results, reused across summaries and regenerations
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS screenshot_ocr_cache (
+                    screenshot_id INTEGER NOT NULL REFERENCES screenshots(id) ON DELETE CASCADE,
+                    cropped INTEGER NOT NULL,
+                    ocr_text TEXT NOT NULL,
+                    extracted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (screenshot_id, cropped)
+                )
+            """)
+
             # Threshold-based summaries - trigger every N screenshots
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS threshold_summaries (
@@ -1353,6 +1373,59 @@ class ActivityStorage:
             )
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_ocr_texts(
+        self, screenshot_ids: List[int], cropped: bool
+    ) -> Dict[int, str]:
+        """Get cached OCR text for multiple screenshots.
+
+        Args:
+            screenshot_ids: Screenshot IDs to look up.
+            cropped: Whether to look up text extracted from the cropped image.
+
+        Returns:
+            Dict mapping screenshot ID to OCR text. Uncached IDs are omitted.
+        """
+        if not screenshot_ids:
+            return {}
+
+        ids = list(dict.fromkeys(screenshot_ids))
+        texts = {}
+        with self.get_connection() as conn:
+            for i in range(0, len(ids), self.MAX_QUERY_PARAMS):
+                chunk = ids[i:i + self.MAX_QUERY_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = conn.execute(
+                    f"""
+                    SELECT screenshot_id, ocr_text FROM screenshot_ocr_cache
+                    WHERE cropped = ? AND screenshot_id IN ({placeholders})
+                    """,
+                    [int(cropped), *chunk],
+                )
+                for row in cursor.fetchall():
+                    texts[row["screenshot_id"]] = row["ocr_text"]
+        return texts
+
+    def save_ocr_texts(self, texts: Dict[int, str], cropped: bool) -> None:
+        """Cache OCR text for multiple screenshots in one transaction.
+
+        Args:
+            texts: Dict mapping screenshot ID to extracted OCR text.
+            cropped: Whether the text was extracted from the cropped image.
+        """
+        if not texts:
+            return
+
+        with self.get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO screenshot_ocr_cache
+                    (screenshot_id, cropped, ocr_text)
+                VALUES (?, ?, ?)
+                """,
+                [(sid, int(cropped), text) for sid, text in texts.items()],
+            )
+            conn.commit()
+
     # =========================================================================
     # Session Summary Methods
     # =========================================================================
@@ -1431,7 +1504,7 @@ class ActivityStorage:
     # ==================== Threshold-Based Summary Methods ====================
 
     def get_unsummarized_screenshots(
-        self, require_session: bool = True, date: str = None
+        self, require_session: bool = True, date: str = None, oldest_first: bool = False
     ) -> List[Dict]:
         """Get screenshots not covered by any threshold summary.
 
@@ -1441,16 +1514,21 @@ class ActivityStorage:
                 screenshots (useful for "Generate Missing" backfill).
             date: Optional date string (YYYY-MM-DD) to filter screenshots to
                 a specific day. If None, returns all unsummarized screenshots.
+            oldest_first: If True, order by timestamp ASC instead of DESC
+                (for callers that walk screenshots chronologically).
 
         Returns:
-            List of screenshot dicts ordered by timestamp DESC (recent first),
-            each containing id, timestamp, filepath, window_title, app_name.
+            List of screenshot dicts ordered by timestamp DESC (recent first)
+            unless oldest_first is set, each containing id, timestamp,
+            filepath, window_title, app_name.
 
         Note:
-            Screenshots are returned in reverse chronological order so that
-            the most recent activity is summarized first, providing immediate
-            value to users viewing today's timeline.
+            Screenshots are returned in reverse chronological order by default
+            so that the most recent activity is summarized first, providing
+            immediate value to users viewing today's timeline.
         """
+        order = "ASC" if oldest_first else "DESC"
+
         # Build date filter if provided
         date_filter = ""
         params = []
@@ -1481,7 +1559,7 @@ class ActivityStorage:
                         WHERE ss.screenshot_id = s.id
                     )
                     {date_filter}
-                    ORDER BY s.timestamp DESC
+                    ORDER BY s.timestamp {order}
                 """, params)
             else:
                 # All unsummarized screenshots (for backfill)
@@ -1494,7 +1572,7 @@ class ActivityStorage:
                         WHERE tss.screenshot_id = s.id
                     )
                     {date_filter}
-                    ORDER BY s.timestamp DESC
+                    ORDER BY s.timestamp {order}
                 """, params)
             return [dict(row) for row in cursor.fetchall()]
 
@@ -2009,6 +2087,42 @@ class ActivityStorage:
             row = cursor.fetchone()
             return dict(row) if row else None
 
+    def get_screenshots_by_ids(self, screenshot_ids: List[int]) -> List[Dict]:
+        """Get multiple screenshots by ID in a single query.
+
+        IDs are queried in chunks to stay under SQLite's bound-parameter
+        limit. Missing IDs are skipped.
+
+        Args:
+            screenshot_ids: Screenshot IDs to fetch.
+
+        Returns:
+            List of screenshot dicts in the same order as screenshot_ids.
+        """
+        if not screenshot_ids:
+            return []
+
+        ids = list(dict.fromkeys(screenshot_ids))
+        rows_by_id = {}
+        with self.get_connection() as conn:
+            for i in range(0, len(ids), self.MAX_QUERY_PARAMS):
+                chunk = ids[i:i + self.MAX_QUERY_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = conn.execute(
+                    f"""
+                    SELECT id, timestamp, filepath, window_title, app_name,
+                           window_x, window_y, window_width, window_height,
+                           monitor_name, monitor_width, monitor_height
+                    FROM screenshots
+                    WHERE id IN ({placeholders})
+                    """,
+                    chunk,
+                )
+                for row in cursor.fetchall():
+                    rows_by_id[row['id']] = dict(row)
+
+        return [rows_by_id[sid] for sid in ids if sid in rows_by_id]
+
     # =========================================================================
     # Tag Management Methods
     # =========================================================================
@@ -2259,6 +2373,81 @@ class ActivityStorage:
             )
             return cursor.fetchone() is not None
 
+    def get_time_range_status(
+        self, start: 'datetime', end: 'datetime'
+    ) -> Tuple[bool, bool]:
+        """Check a time slot for an existing summary and for activity in one query.
+
+        Combines has_summary_for_time_range() and
+        has_active_session_in_range(), which scheduled summarization checks
+        back to back for every slot.
+
+        Args:
+            start: Start datetime of the range.
+            end: End datetime of the range.
+
+        Returns:
+            Tuple of (summary exists for exactly this range,
+            at least one session overlaps the range).
+        """
+        start_iso = start.isoformat()
+        end_iso = end.isoformat()
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT
+                    EXISTS(
+                        SELECT 1 FROM threshold_summaries
+                        WHERE start_time = :start AND end_time = :end
+                    ),
+                    EXISTS(
+                        SELECT 1 FROM activity_sessions
+                        WHERE datetime(start_time) < datetime(:end)
+                          AND (end_time IS NULL OR datetime(end_time) > datetime(:start))
+                    )
+                """,
+                {"start": start_iso, "end": end_iso},
+            )
+            has_summary, has_session = cursor.fetchone()
+            return bool(has_summary), bool(has_session)
+
+    def get_session_intervals(
+        self, start: 'datetime', end: 'datetime'
+    ) -> List[Tuple[datetime, Optional[datetime]]]:
+        """Get (start, end) times of all sessions overlapping a time range.
+
+        Bulk counterpart to has_active_session_in_range(): callers checking
+        many slots fetch the sessions once and test each slot in Python.
+        Times are normalized by SQLite's datetime() exactly as in
+        has_active_session_in_range().
+
+        Args:
+            start: Start datetime of the range.
+            end: End datetime of the range.
+
+        Returns:
+            List of (start, end) naive datetimes ordered by start; end is None
+            for a session that is still active.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT datetime(start_time) AS start_time, datetime(end_time) AS end_time
+                FROM activity_sessions
+                WHERE datetime(start_time) < datetime(?)
+                  AND (end_time IS NULL OR datetime(end_time) > datetime(?))
+                ORDER BY datetime(start_time)
+                """,
+                (end.isoformat(), start.isoformat()),
+            )
+            return [
+                (
+                    datetime.fromisoformat(row["start_time"]),
+                    datetime.fromisoformat(row["end_time"]) if row["end_time"] else None,
+                )
+                for row in cursor.fetchall()
+            ]
+
     def get_recent_sessions(self, limit: int = 20) -> List[Dict]:
         """Get most recent completed sessions, ordered by end_time DESC.
 
@@ -2293,6 +2482,40 @@ class ActivityStorage:
                 results.append(result)
             return results
 
+    def get_sessions_up_to(self, session_id: int, limit: int = 20) -> List[Dict]:
+        """Get a completed session and the sessions that ended before it.
+
+        Used for session merging in activity-based summarization. Returns only
+        the columns needed to walk backward through fragmented sessions, plus
+        start_seconds/end_seconds (Julian day times in seconds, computed by
+        SQLite) so gaps can be measured without parsing timestamps in Python.
+        Only differences between these values are meaningful.
+
+        Args:
+            session_id: ID of the completed session to start from.
+            limit: Maximum number of sessions to return (default: 20).
+
+        Returns:
+            List of dicts with id, start_time, end_time, start_seconds and
+            end_seconds, ordered by end_time DESC with the given session first.
+            Empty if the session does not exist or has not ended.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT id, start_time, end_time,
+                       julianday(start_time) * 86400.0 AS start_seconds,
+                       julianday(end_time) * 86400.0 AS end_seconds
+                FROM activity_sessions
+                WHERE end_time IS NOT NULL
+                  AND end_time <= (SELECT end_time FROM activity_sessions WHERE id = ?)
+                ORDER BY end_time DESC, id = ? DESC
+                LIMIT ?
+                """,
+                (session_id, session_id, limit),
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
     def get_sessions_without_summaries(self, min_duration_seconds: int = 300) -> List[Dict]:
         """Find completed sessions that have no corresponding summary.
 
@@ -2504,6 +2727,41 @@ class ActivityStorage:
             )
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_focus_events_clipped_to_range(
+        self, start: 'datetime', end: 'datetime'
+    ) -> List[Dict]:
+        """Get focus events overlapping a time range, with durations clipped to it.
+
+        Same events as get_focus_events_overlapping_range(), but SQLite
+        computes duration_seconds as the part of each event that falls inside
+        the range (an ongoing event counts up to the range end). Events with
+        no time inside the range are omitted.
+
+        Args:
+            start: Start datetime.
+            end: End datetime.
+
+        Returns:
+            List of focus event dicts ordered by start_time.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT id, window_title, app_name, window_class,
+                       start_time, end_time, session_id, terminal_context,
+                       (MIN(julianday(COALESCE(end_time, :end)), julianday(:end))
+                        - MAX(julianday(start_time), julianday(:start))) * 86400.0
+                           AS duration_seconds
+                FROM window_focus_events
+                WHERE datetime(start_time) < datetime(:end)
+                  AND (datetime(end_time) > datetime(:start) OR end_time IS NULL)
+                  AND duration_seconds > 0
+                ORDER BY start_time ASC
+                """,
+                {"start": start.isoformat(), "end": end.isoformat()},
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
     def get_app_durations_in_range(self, start: 'datetime', end: 'datetime') -> List[Dict]:
         """Aggregate duration by app, sorted by total time descending.
 
@@ -15,21 +15,136 @@ The worker supports:
 - Focus-based app/window usage passed to LLM
 """
 
+import bisect
+import dataclasses
+import functools
 import json
 import logging
-import queue
+import os
+import re
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from pathlib import Path
+from enum import Enum
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .storage import ActivityStorage
-    from .config import ConfigManager
+    from .config import ConfigManager, SummarizationConfig
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on queued tasks; enough for a full day of 5-minute slots
+_MAX_PENDING_TASKS = 512
+
+# Longest range force_summarize_pending merges back-to-back slots into; one
+# summary only samples max_samples screenshots, so longer stretches are split
+_MAX_FORCE_RANGE_MINUTES = 120
+
+
+class _EnqueueResult(Enum):
+    """Outcome of SummarizerWorker._enqueue_unique()."""
+    QUEUED = "queued"
+    DUPLICATE = "duplicate"
+    FULL = "full"
+
+
+# Concurrent Tesseract processes per OCR batch (each runs single-threaded)
+_OCR_WORKERS = os.cpu_count() or 1
+
+# Bounds on how long the idle run loop blocks waiting for a task. The upper
+# bound keeps wall-clock deadlines honest across suspend/resume and clock changes.
+_MIN_IDLE_WAIT_SECONDS = 1.0
+_MAX_IDLE_WAIT_SECONDS = 300.0
+
+# (config_snapshot key, SummarizationConfig attribute) pairs stored with each summary
+_SNAPSHOT_FIELDS = (
+    ('model', 'model'),
+    ('threshold', 'trigger_threshold'),
+    ('include_focus_context', 'include_focus_context'),
+    ('include_screenshots', 'include_screenshots'),
+    ('include_ocr', 'include_ocr'),
+    ('crop_to_window', 'crop_to_window'),
+    ('include_previous_summary', 'include_previous_summary'),
+    ('max_samples', 'max_samples'),
+    ('sample_interval_minutes', 'sample_interval_minutes'),
+    ('focus_weighted_sampling', 'focus_weighted_sampling'),
+    ('frequency_minutes', 'frequency_minutes'),
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse a stored ISO-8601 timestamp into a naive datetime.
+
+    Accepts both 'YYYY-MM-DDTHH:MM:SS[.ffffff][Z|+HH:MM]' and SQLite's
+    'YYYY-MM-DD HH:MM:SS'. Any timezone suffix is dropped so the wall-clock
+    time compares directly against the naive local datetimes used elsewhere.
+
+    Results are memoized: session and focus-event boundaries are re-read
+    (and re-parsed) many times during recovery and backfill.
+
+    Raises:
+        ValueError: If value is not a valid ISO-8601 string.
+        TypeError: If value is not a string.
+    """
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is not None:
+        dt = dt.replace(tzinfo=None)
+    return dt
+
+
+def _wants_focus_events(cfg) -> bool:
+    """Return whether summarization will use focus events at all.
+
+    Focus events feed both the prompt's activity breakdown and
+    focus-weighted screenshot sampling; with both disabled there is
+    no point querying them.
+    """
+    return cfg.include_focus_context or cfg.focus_weighted_sampling
+
+
+# Unsaved/modified markers editors add to otherwise identical window titles,
+# e.g. "● main.py - Code", "*notes.txt - gedit", "report.odt (modified)"
+_TITLE_MARKERS_RE = re.compile(
+    r"^(?:●|\*)\s*|\s*(?:\*|\s-\s(?:modified|unsaved)|\((?:modified|unsaved)\))\s*$",
+    re.IGNORECASE,
+)
+
+
+def _ocr_title_key(title: str) -> str:
+    """Return the key _gather_ocr dedupes window titles by.
+
+    Drops editor unsaved/modified markers, collapses whitespace and
+    ignores case, so a document's title before and after an edit is
+    OCR'd once.
+    """
+    return " ".join(_TITLE_MARKERS_RE.sub("", title).split()).lower()
+
+
+def _merge_intervals(
+    intervals: List[Tuple[datetime, Optional[datetime]]],
+    max_gap: timedelta = timedelta(0),
+) -> List[Tuple[datetime, datetime]]:
+    """Merge (start, end) intervals sorted by start into disjoint intervals.
+
+    An end of None (a session still in progress) is treated as open-ended.
+    Intervals separated by a gap shorter than max_gap are merged as well,
+    mirroring how _get_merged_session_bounds joins restart-fragmented sessions.
+    """
+    merged = []
+    for start, end in intervals:
+        end = end or datetime.max
+        if merged and (start <= merged[-1][1] or start - merged[-1][1] < max_gap):
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
 
 class SummarizerWorker:
     """Background worker with activity-based session summarization.
@@ -54,12 +169,29 @@ class SummarizerWorker:
         self.storage = storage
         self.config = config
         self._summarizer = None  # Lazy load to avoid import issues
-        self._summarizer_model = None  # Track which model the summarizer was created with
+        self._summarizer_key = None  # (model, ollama_host) the summarizer was created with
+        self._summarizer_lock = threading.Lock()  # Serializes lazy creation of the summarizer and OCR pool
+        self._report_generator = None  # ReportGenerator bound to the current summarizer
+        self._http_session = None  # Pooled requests.Session shared across summarizers
+        self._http_session_host: Optional[str] = None  # Ollama host the session was made for
+        self._cfg_snapshot: Optional["SummarizationConfig"] = None  # Cached summarization settings
+        self._cfg_version: Optional[int] = None  # ConfigManager.version the snapshot was taken at
+        self._config_snapshot: Optional[Dict] = None  # config_snapshot dict saved with summaries
+        self._config_snapshot_source: Optional["SummarizationConfig"] = None  # Settings it was built from
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self._pending_queue: queue.Queue = queue.Queue()  # For regenerate/force/session_end tasks
+        self._pending_tasks: deque = deque()  # For regenerate/force/session_end tasks
+        self._pending_cv = threading.Condition()  # Guards _pending_tasks/_wake_requested, wakes the run loop
+        self._wake_requested: bool = False  # Set by _wake() to end the run loop's wait early
+        self._ocr_pool: Optional[ThreadPoolExecutor] = None  # Lazily created OCR thread pool
+        self._pending_ids_lock = threading.Lock()  # Guards the queued-id sets below
+        self._regenerate_pending: set = set()  # Summary IDs with a queued regenerate task
+        self._session_end_pending: set = set()  # Session IDs with a queued session_end task
         self._current_task: Optional[str] = None
         self._last_summarized_end: Optional[datetime] = None  # Track last summarized period
+        self._last_summary: Optional[Tuple[str, str]] = None  # Cached (end_time, summary) of latest summary
+        self._last_summary_known: bool = False  # Whether _last_summary reflects the database
+        self._last_summary_lock = threading.Lock()  # Guards _last_summary during parallel recovery
         self._last_daily_report_date: Optional[str] = None  # Track date of last daily report
         self._last_weekly_report_week: Optional[str] = None  # Track week of last weekly report
         self._last_monthly_report_month: Optional[str] = None  # Track month of last monthly report
@@ -70,30 +202,127 @@ class SummarizerWorker:
         self._current_session_start: Optional[datetime] = None  # When active session started
         self._current_session_id: Optional[int] = None  # ID of current active session
         self._last_preview_time: Optional[datetime] = None  # When last preview was generated
+        self._next_preview_eligible: Optional[datetime] = None  # Earliest time a preview can be due
+
+    def _summarization_config(self) -> "SummarizationConfig":
+        """Return a snapshot of the summarization settings.
+
+        The snapshot is a private copy rebuilt only when the ConfigManager
+        version changes, so the run loop does not re-walk the config tree on
+        every wakeup, and a task sees one consistent set of settings even if
+        they are edited from the web UI while it runs.
+
+        Returns:
+            SummarizationConfig copy; treat as read-only
+        """
+        version = self.config.version
+        if self._cfg_snapshot is None or self._cfg_version != version:
+            self._cfg_snapshot = dataclasses.replace(self.config.config.summarization)
+            self._cfg_version = version
+        return self._cfg_snapshot
+
+    def _config_snapshot_for(self, cfg: "SummarizationConfig") -> Dict:
+        """Return the config_snapshot dict to store with summaries made under cfg.
+
+        Built once per settings snapshot and shared between summaries; copy
+        it before modifying.
+
+        Args:
+            cfg: Settings snapshot from _summarization_config()
+
+        Returns:
+            Dict of the settings recorded in each summary's config_snapshot
+        """
+        if self._config_snapshot_source is not cfg:
+            self._config_snapshot = {key: getattr(cfg, attr) for key, attr in _SNAPSHOT_FIELDS}
+            self._config_snapshot_source = cfg
+        return self._config_snapshot
 
     @property
     def summarizer(self):
-        """Lazy-load the HybridSummarizer, recreating if model changed."""
-        current_model = self.config.config.summarization.model
-        current_host = self.config.config.summarization.ollama_host
-        cfg = self.config.config.summarization
-
-        # Recreate summarizer if model or host changed
-        if self._summarizer is None or self._summarizer_model != current_model:
-            from .vision import HybridSummarizer
-            logger.info(f"Creating summarizer with model: {current_model}")
-            self._summarizer = HybridSummarizer(
-                model=current_model,
-                ollama_host=current_host,
-                max_samples=cfg.max_samples,
-                sample_interval_minutes=cfg.sample_interval_minutes,
-                focus_weighted_sampling=cfg.focus_weighted_sampling,
-                include_focus_context=getattr(cfg, 'include_focus_context', True),
-                include_screenshots=getattr(cfg, 'include_screenshots', True),
-                include_ocr=getattr(cfg, 'include_ocr', True),
-            )
-            self._summarizer_model = current_model
-        return self._summarizer
+        """Lazy-load the HybridSummarizer, recreating if model or host changed.
+
+        Safe to call from multiple threads: creation is guarded by a lock
+        so a model change never builds two summarizers concurrently.
+        """
+        cfg = self._summarization_config()
+        current_key = (cfg.model, cfg.ollama_host)
+
+        # Fast path: no lock needed when the cached summarizer is current
+        summarizer = self._summarizer
+        if summarizer is not None and self._summarizer_key == current_key:
+            return summarizer
+
+        with self._summarizer_lock:
+            # Re-check: another thread may have created it while we waited
+            if self._summarizer is None or self._summarizer_key != current_key:
+                from .vision import HybridSummarizer
+                logger.info(f"Creating summarizer with model: {cfg.model}")
+                self._summarizer = HybridSummarizer(
+                    model=cfg.model,
+                    ollama_host=cfg.ollama_host,
+                    http_session=self._get_http_session(cfg.ollama_host),
+                    max_samples=cfg.max_samples,
+                    sample_interval_minutes=cfg.sample_interval_minutes,
+                    focus_weighted_sampling=cfg.focus_weighted_sampling,
+                    include_focus_context=cfg.include_focus_context,
+                    include_screenshots=cfg.include_screenshots,
+                    include_ocr=cfg.include_ocr,
+                )
+                self._summarizer_key = current_key
+            return self._summarizer
+
+    def _get_report_generator(self):
+        """Return the shared ReportGenerator, rebuilding it if the summarizer changed.
+
+        Returns:
+            ReportGenerator bound to the current summarizer
+        """
+        summarizer = self.summarizer
+        generator = self._report_generator
+        if generator is None or generator.summarizer is not summarizer:
+            from .reports import ReportGenerator
+            generator = ReportGenerator(self.storage, summarizer, self.config)
+            self._report_generator = generator
+        return generator
+
+    def _get_http_session(self, host: str):
+        """Return the pooled HTTP session for Ollama, recreating it on host change.
+
+        Keeps TCP connections to Ollama alive across summary calls and across
+        summarizer recreation (e.g. after a model change). Connection failures
+        are retried briefly; POSTs are never retried once sent.
+
+        Must be called with _summarizer_lock held.
+
+        Args:
+            host: Ollama base URL the session will talk to
+
+        Returns:
+            A requests.Session with a bounded connection pool
+        """
+        if self._http_session is not None and self._http_session_host == host:
+            return self._http_session
+
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        if self._http_session is not None:
+            self._http_session.close()
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        self._http_session = session
+        self._http_session_host = host
+        return session
 
     def _get_schedule_slot(self, dt: datetime, frequency_minutes: int) -> datetime:
         """Get the schedule slot for a given datetime.
@@ -108,6 +337,11 @@ class SummarizerWorker:
         Returns:
             Datetime rounded down to the nearest slot boundary
         """
+        # Common case (15/30/60...): slots never cross an hour boundary
+        if 60 % frequency_minutes == 0:
+            slot_minute = dt.minute - dt.minute % frequency_minutes
+            return dt.replace(minute=slot_minute, second=0, microsecond=0)
+
         # Calculate minutes since midnight
         minutes_since_midnight = dt.hour * 60 + dt.minute
         # Round down to nearest frequency_minutes boundary
@@ -125,7 +359,7 @@ class SummarizerWorker:
         Returns:
             Next scheduled datetime
         """
-        frequency_minutes = self.config.config.summarization.frequency_minutes
+        frequency_minutes = self._summarization_config().frequency_minutes
         now = datetime.now()
 
         # Get current slot
@@ -147,7 +381,7 @@ class SummarizerWorker:
         Returns:
             Tuple of (start_time, end_time)
         """
-        frequency_minutes = self.config.config.summarization.frequency_minutes
+        frequency_minutes = self._summarization_config().frequency_minutes
         slot_start = slot_end - timedelta(minutes=frequency_minutes)
         return (slot_start, slot_end)
 
@@ -161,15 +395,8 @@ class SummarizerWorker:
         if not last_summary:
             return None
 
-        end_time_str = last_summary.get('end_time', '')
         try:
-            if 'T' in end_time_str:
-                end_time = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
-                if end_time.tzinfo:
-                    end_time = end_time.replace(tzinfo=None)
-            else:
-                end_time = datetime.strptime(end_time_str, '%Y-%m-%d %H:%M:%S')
-            return end_time
+            return _parse_iso(last_summary.get('end_time', ''))
         except (ValueError, TypeError):
             return None
 
@@ -194,9 +421,13 @@ class SummarizerWorker:
             return
 
         self._running = False
+        self._wake()
         if self._thread:
             self._thread.join(timeout=5)
             self._thread = None
+        if self._ocr_pool is not None:
+            self._ocr_pool.shutdown(wait=False, cancel_futures=True)
+            self._ocr_pool = None
         logger.info("SummarizerWorker stopped")
 
     def check_and_queue(self):
@@ -209,28 +440,121 @@ class SummarizerWorker:
         # No-op: scheduling is now handled internally by _run_loop
         pass
 
+    def _enqueue(self, task: Tuple[str, object]) -> bool:
+        """Add a task to the pending queue without blocking the caller.
+
+        Args:
+            task: (task_type, payload) tuple
+
+        Returns:
+            True if queued, False if the queue is full.
+        """
+        with self._pending_cv:
+            if len(self._pending_tasks) >= _MAX_PENDING_TASKS:
+                logger.warning(
+                    f"Summarizer queue full ({_MAX_PENDING_TASKS} tasks), "
+                    f"dropping {task[0]} task"
+                )
+                return False
+            self._pending_tasks.append(task)
+            self._pending_cv.notify()
+        return True
+
+    def _wake(self):
+        """Interrupt the run loop's wait so it re-checks its schedule."""
+        with self._pending_cv:
+            self._wake_requested = True
+            self._pending_cv.notify()
+
+    def _next_task(self, timeout: float) -> Optional[Tuple[str, object]]:
+        """Wait for the next queued task.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            (task_type, payload) tuple, or None if the wait timed out, the
+            worker is stopping, or _wake() was called.
+        """
+        with self._pending_cv:
+            self._pending_cv.wait_for(
+                lambda: self._pending_tasks or self._wake_requested or not self._running,
+                timeout=timeout,
+            )
+            self._wake_requested = False
+            if self._pending_tasks and self._running:
+                return self._pending_tasks.popleft()
+            return None
+
+    def _enqueue_unique(
+        self, task: Tuple[str, object], key: int, pending: set
+    ) -> _EnqueueResult:
+        """Queue a task unless one for the same ID is already waiting.
+
+        The duplicate and queue-full checks are made together under the
+        queue's condition lock, so the result reflects a single moment.
+
+        Args:
+            task: (task_type, payload) tuple
+            key: ID the task is for
+            pending: Set of IDs with a queued task of this type
+
+        Returns:
+            QUEUED, DUPLICATE if a task for key is already waiting, or FULL
+            if the queue is full.
+        """
+        with self._pending_cv, self._pending_ids_lock:
+            if key in pending:
+                logger.debug("%s for %s already queued, skipping", task[0], key)
+                return _EnqueueResult.DUPLICATE
+            if len(self._pending_tasks) >= _MAX_PENDING_TASKS:
+                logger.warning(
+                    f"Summarizer queue full ({_MAX_PENDING_TASKS} tasks), "
+                    f"dropping {task[0]} task"
+                )
+                return _EnqueueResult.FULL
+            pending.add(key)
+            self._pending_tasks.append(task)
+            self._pending_cv.notify()
+        return _EnqueueResult.QUEUED
+
+    def _mark_dequeued(self, task_type: str, payload):
+        """Forget a dequeued regenerate/session_end task so its ID can be queued again."""
+        with self._pending_ids_lock:
+            if task_type == 'regenerate':
+                self._regenerate_pending.discard(payload)
+            elif task_type == 'session_end':
+                self._session_end_pending.discard(payload[0])
+
     def queue_regenerate(self, summary_id: int):
         """Queue a summary for regeneration.
 
+        Repeated requests for a summary that is still waiting in the queue
+        are ignored.
+
         Args:
             summary_id: ID of the summary to regenerate
         """
-        self._pending_queue.put(('regenerate', summary_id))
-        logger.info(f"Queued summary {summary_id} for regeneration")
+        result = self._enqueue_unique(('regenerate', summary_id), summary_id, self._regenerate_pending)
+        if result is _EnqueueResult.QUEUED:
+            logger.info("Queued summary %s for regeneration", summary_id)
 
     def queue_session_end(self, session_id: int):
         """Queue a session for summarization after it ends.
 
         Called by the daemon when a user goes AFK. The worker will
         apply debouncing before actually summarizing to handle
-        brief returns.
+        brief returns. Repeated calls for a session that is still waiting
+        in the queue are ignored.
 
         Args:
             session_id: ID of the session that just ended
         """
         scheduled_at = datetime.now()
-        self._pending_queue.put(('session_end', (session_id, scheduled_at)))
-        logger.info(f"Queued session {session_id} for summarization")
+        task = ('session_end', (session_id, scheduled_at))
+        result = self._enqueue_unique(task, session_id, self._session_end_pending)
+        if result is _EnqueueResult.QUEUED:
+            logger.info("Queued session %s for summarization", session_id)
 
     def notify_session_start(self, session_id: int = None):
         """Notify the worker that a new session has started.
@@ -244,71 +568,120 @@ class SummarizerWorker:
         Args:
             session_id: ID of the new session (for preview tracking)
         """
-        self._last_session_active_time = datetime.now()
-        self._current_session_start = datetime.now()
+        now = datetime.now()
+        cfg = self._summarization_config()
+        self._last_session_active_time = now
+        self._current_session_start = now
         self._current_session_id = session_id
         self._last_preview_time = None  # Reset preview timer for new session
+        # First preview needs a minimum-length session and one full interval
+        self._next_preview_eligible = now + timedelta(seconds=max(
+            cfg.min_session_duration_seconds, cfg.preview_interval_minutes * 60
+        ))
+        self._wake()  # Preview schedule changed
 
     def force_summarize_pending(self, date: str = None) -> int:
         """Force immediate summarization of unsummarized time slots.
 
-        Groups unsummarized screenshots into cron-aligned time slots and queues
-        each slot for summarization. This is useful for backfilling gaps.
+        Groups unsummarized screenshots into cron-aligned time slots, merges
+        runs of back-to-back active slots from one logical session into a
+        single range (at most _MAX_FORCE_RANGE_MINUTES long), and queues each
+        range for summarization. This is useful for backfilling gaps.
 
         Args:
             date: Optional date string (YYYY-MM-DD) to limit to a specific day.
                 If None, processes all unsummarized screenshots.
 
         Returns:
-            Number of time slots queued for summarization.
+            Number of time ranges queued for summarization.
         """
         # Get unsummarized screenshots to find which time slots need processing
+        # (oldest first, so no re-sort is needed)
         unsummarized = self.storage.get_unsummarized_screenshots(
-            require_session=False, date=date
+            require_session=False, date=date, oldest_first=True
         )
         if not unsummarized:
             logger.info("No unsummarized screenshots to process")
             return 0
 
-        # Sort by timestamp
-        unsummarized = sorted(unsummarized, key=lambda s: s['timestamp'])
-
-        # Group into cron-aligned time slots
-        frequency_minutes = self.config.config.summarization.frequency_minutes
-        slots_to_process = set()
-
-        for screenshot in unsummarized:
-            ts = screenshot['timestamp']
-            dt = datetime.fromtimestamp(ts)
-            # Get the slot this screenshot belongs to
+        # Group into cron-aligned time slots. Timestamps are sorted, so once a
+        # slot is known we can binary-search past every screenshot inside it
+        # instead of computing a slot per screenshot.
+        cfg = self._summarization_config()
+        frequency_minutes = cfg.frequency_minutes
+        timestamps = [s['timestamp'] for s in unsummarized]
+        sorted_slots = []
+
+        i = 0
+        while i < len(timestamps):
+            dt = datetime.fromtimestamp(timestamps[i])
             slot_start = self._get_schedule_slot(dt, frequency_minutes)
             slot_end = slot_start + timedelta(minutes=frequency_minutes)
-            slots_to_process.add((slot_start, slot_end))
-
-        # Sort slots chronologically
-        sorted_slots = sorted(slots_to_process, key=lambda x: x[0])
-
-        # Filter out slots where user was entirely AFK
+            sorted_slots.append((slot_start, slot_end))
+            i = bisect.bisect_left(timestamps, slot_end.timestamp(), i + 1)
+
+        # Filter out slots where user was entirely AFK. Sessions covering the
+        # whole backfill window are fetched once (merged into disjoint
+        # intervals) instead of querying per slot.
+        session_intervals = self.storage.get_session_intervals(
+            sorted_slots[0][0], sorted_slots[-1][1]
+        )
+        intervals = _merge_intervals(session_intervals)
+        interval_starts = [start for start, _ in intervals]
+        # Logical sessions: restart-fragmented sessions joined with the same
+        # merge-gap rule as _get_merged_session_bounds
+        logical_sessions = _merge_intervals(
+            session_intervals, timedelta(seconds=cfg.session_merge_gap_seconds)
+        )
+        logical_starts = [start for start, _ in logical_sessions]
         active_slots = []
         afk_slots = 0
         for slot_start, slot_end in sorted_slots:
-            if self.storage.has_active_session_in_range(slot_start, slot_end):
-                active_slots.append((slot_start, slot_end))
+            # Last interval starting before the slot ends; active if it is
+            # still running at the slot start (earlier ones end before it)
+            j = bisect.bisect_left(interval_starts, slot_end) - 1
+            if j >= 0 and intervals[j][1] > slot_start:
+                session = bisect.bisect_left(logical_starts, slot_end) - 1
+                active_slots.append((slot_start, slot_end, session))
             else:
                 afk_slots += 1
 
         if afk_slots > 0:
-            logger.info(f"Skipping {afk_slots} time slots where user was AFK")
-
-        # Queue each active time slot for summarization
-        for slot_start, slot_end in active_slots:
-            self._pending_queue.put(('summarize_range', (slot_start, slot_end)))
+            logger.info("Skipping %d time slots where user was AFK", afk_slots)
+
+        # Merge back-to-back active slots of one logical session so a
+        # continuous stretch of activity costs one LLM call. AFK or empty
+        # slots, a new session, or reaching the range cap break the run.
+        max_range = timedelta(minutes=_MAX_FORCE_RANGE_MINUTES)
+        ranges = []
+        range_sessions = []
+        for slot_start, slot_end, session in active_slots:
+            if (
+                ranges
+                and ranges[-1][1] == slot_start
+                and range_sessions[-1] == session
+                and slot_end - ranges[-1][0] <= max_range
+            ):
+                ranges[-1] = (ranges[-1][0], slot_end)
+            else:
+                ranges.append((slot_start, slot_end))
+                range_sessions.append(session)
+
+        # Queue each range for summarization. If the queue fills up, the
+        # remaining ranges stay unsummarized and are picked up by the next
+        # force run.
+        queued = 0
+        for range_start, range_end in ranges:
+            if not self._enqueue(('summarize_range', (range_start, range_end))):
+                break
+            queued += 1
 
         logger.info(
-            f"Force-queued {len(active_slots)} time slots for summarization "
-            f"({frequency_minutes}min intervals, skipped {afk_slots} AFK slots)"
+            "Force-queued %d time ranges for summarization "
+            "(%d %dmin slots, skipped %d AFK slots)",
+            queued, len(active_slots), frequency_minutes, afk_slots,
         )
-        return len(active_slots)
+        return queued
 
     def force_summarize_sessions(self, date: str = None) -> int:
         """Force immediate summarization of unsummarized sessions.
@@ -324,11 +697,12 @@ class SummarizerWorker:
         Returns:
             Number of sessions queued for summarization.
         """
-        if not self.config.config.summarization.enabled:
+        cfg = self._summarization_config()
+        if not cfg.enabled:
             logger.info("Summarization is disabled, skipping force_summarize_sessions")
             return 0
 
-        min_duration = self.config.config.summarization.min_session_duration_seconds
+        min_duration = cfg.min_session_duration_seconds
         unsummarized = self.storage.get_sessions_without_summaries(min_duration)
 
         if not unsummarized:
@@ -349,16 +723,23 @@ class SummarizerWorker:
 
         logger.info(f"Found {len(unsummarized)} unsummarized sessions to process")
 
-        # Queue each session for summarization
+        # Queue each session for summarization, skipping ones already waiting
+        queued = 0
         for session in unsummarized:
             session_id = session['id']
-            self._pending_queue.put(('session_end', (session_id, datetime.now())))
+            task = ('session_end', (session_id, datetime.now()))
+            result = self._enqueue_unique(task, session_id, self._session_end_pending)
+            if result is _EnqueueResult.FULL:
+                break
+            if result is _EnqueueResult.DUPLICATE:
+                continue
+            queued += 1
             logger.info(
-                f"Queued session {session_id} for summarization: "
-                f"{session['start_time']} - {session['end_time']}"
+                "Queued session %s for summarization: %s - %s",
+                session_id, session['start_time'], session['end_time'],
             )
 
-        return len(unsummarized)
+        return queued
 
     def get_status(self) -> Dict:
         """Get current worker status.
@@ -369,7 +750,7 @@ class SummarizerWorker:
         return {
             "running": self._running,
             "current_task": self._current_task,
-            "queue_size": self._pending_queue.qsize(),
+            "queue_size": len(self._pending_tasks),
             "mode": "activity-based",
         }
 
@@ -384,6 +765,7 @@ class SummarizerWorker:
 
         while self._running:
             now = datetime.now()
+            cfg = self._summarization_config()
 
             # Run startup tasks once
             if not self._startup_backfill_done:
@@ -392,51 +774,101 @@ class SummarizerWorker:
                 self._startup_backfill_done = True
 
             # Check if we should generate daily reports (at/after midnight)
-            self._maybe_generate_daily_reports(now)
+            self._maybe_generate_daily_reports(now, cfg)
 
             # Check if we should generate weekly reports (Sunday 00:05)
-            self._maybe_generate_weekly_reports(now)
+            self._maybe_generate_weekly_reports(now, cfg)
 
             # Check if we should generate monthly reports (1st of month 00:10)
-            self._maybe_generate_monthly_reports(now)
+            self._maybe_generate_monthly_reports(now, cfg)
 
             # Check if we should generate/update preview summary for active session
-            self._maybe_generate_preview(now)
+            self._maybe_generate_preview(now, cfg)
+
+            # Sleep until the next scheduled check unless a task arrives first
+            now = datetime.now()
+            timeout = (self._next_wakeup(now, cfg) - now).total_seconds()
+            timeout = min(max(timeout, _MIN_IDLE_WAIT_SECONDS), _MAX_IDLE_WAIT_SECONDS)
 
             # Process tasks from queue
-            try:
-                task = self._pending_queue.get(timeout=1)
-                task_type, payload = task
-                self._current_task = task_type
+            task = self._next_task(timeout)
+            if task is None:
+                # Timed out or woken without a task, continue to next iteration
+                continue
 
-                try:
-                    if task_type == 'session_end':
-                        # Activity-based: summarize a completed session
-                        session_id, scheduled_at = payload
-                        self._process_session_end(session_id, scheduled_at)
-                    elif task_type == 'summarize_range':
-                        # Force summarize with time range (manual backfill)
-                        start_time, end_time = payload
-                        self._do_summarize_time_range(start_time, end_time)
-                    elif task_type == 'summarize':
-                        # Legacy: summarize screenshots list (for force_summarize_pending)
-                        self._do_summarize_screenshots(payload)
-                    elif task_type == 'regenerate':
-                        self._do_regenerate(payload)
-                    elif task_type == 'regenerate_report':
-                        # Regenerate a hierarchical report (daily/weekly/monthly)
-                        period_type, period_date = payload
-                        self._do_regenerate_report(period_type, period_date)
-                except Exception as e:
-                    logger.error(f"Summarization task failed: {e}", exc_info=True)
-                finally:
-                    self._current_task = None
-            except queue.Empty:
-                # No tasks, continue to next iteration
-                pass
+            task_type, payload = task
+            self._mark_dequeued(task_type, payload)
+            self._current_task = task_type
+
+            try:
+                if task_type == 'session_end':
+                    # Activity-based: summarize a completed session
+                    session_id, scheduled_at = payload
+                    self._process_session_end(session_id, scheduled_at)
+                elif task_type == 'summarize_range':
+                    # Force summarize with time range (manual backfill)
+                    start_time, end_time = payload
+                    self._do_summarize_time_range(start_time, end_time)
+                elif task_type == 'summarize':
+                    # Legacy: summarize screenshots list (for force_summarize_pending)
+                    self._do_summarize_screenshots(payload)
+                elif task_type == 'regenerate':
+                    self._do_regenerate(payload)
+                elif task_type == 'regenerate_report':
+                    # Regenerate a hierarchical report (daily/weekly/monthly)
+                    period_type, period_date = payload
+                    self._do_regenerate_report(period_type, period_date)
+            except Exception as e:
+                logger.error(f"Summarization task failed: {e}", exc_info=True)
+            finally:
+                self._current_task = None
+                # The previous-summary cache only spans a burst of queued
+                # tasks; re-read it once the burst is over in case other
+                # writers (e.g. the web UI) changed summaries meanwhile.
+                if not self._pending_tasks:
+                    self._invalidate_last_summary()
 
         logger.info("SummarizerWorker run loop stopped")
 
+    def _next_wakeup(self, now: datetime, cfg: "SummarizationConfig") -> datetime:
+        """Return when the run loop next has periodic work to check.
+
+        Considers the daily (midnight), weekly (Sunday 00:05) and monthly
+        (1st 00:10) report boundaries and, during an active session, the
+        next preview update. Queued tasks wake the loop earlier.
+
+        Args:
+            now: Current datetime
+            cfg: Summarization settings snapshot for this loop iteration
+
+        Returns:
+            Datetime of the soonest upcoming check (may be in the past if a
+            check is already due)
+        """
+        midnight = datetime.combine(now.date(), datetime.min.time())
+
+        # Daily reports: next midnight
+        candidates = [midnight + timedelta(days=1)]
+
+        # Weekly reports: next Sunday 00:05
+        weekly = midnight + timedelta(days=(6 - now.weekday()) % 7, minutes=5)
+        if weekly <= now:
+            weekly += timedelta(days=7)
+        candidates.append(weekly)
+
+        # Monthly reports: next 1st of the month 00:10
+        monthly = midnight.replace(day=1) + timedelta(minutes=10)
+        if monthly <= now:
+            monthly = (midnight.replace(day=28) + timedelta(days=4)).replace(day=1)
+            monthly += timedelta(minutes=10)
+        candidates.append(monthly)
+
+        # Preview: when the active session's next preview becomes due
+        if cfg.enabled and self._next_preview_eligible is not None:
+            candidates.append(self._next_preview_eligible)
+
+        return min(candidates)
+
     def _process_session_end(self, session_id: int, scheduled_at: datetime):
         """Process a session_end event with debouncing and session merging.
 
@@ -449,11 +881,11 @@ class SummarizerWorker:
             session_id: ID of the session that ended
             scheduled_at: When the session_end was scheduled
         """
-        if not self.config.config.summarization.enabled:
+        cfg = self._summarization_config()
+        if not cfg.enabled:
             logger.debug("Summarization disabled, skipping session_end")
             return
 
-        cfg = self.config.config.summarization
         debounce_seconds = cfg.session_debounce_seconds
         min_duration = cfg.min_session_duration_seconds
         merge_gap = cfg.session_merge_gap_seconds
@@ -461,7 +893,7 @@ class SummarizerWorker:
         # Check debounce: did user return since this was scheduled?
         if self._last_session_active_time and self._last_session_active_time > scheduled_at:
             logger.info(
-                f"Skipping session {session_id} - user returned within debounce period"
+                "Skipping session %s - user returned within debounce period", session_id
             )
             return
 
@@ -474,7 +906,7 @@ class SummarizerWorker:
         # Re-check after sleeping - user might have returned
         if self._last_session_active_time and self._last_session_active_time > scheduled_at:
             logger.info(
-                f"Skipping session {session_id} - user returned during debounce"
+                "Skipping session %s - user returned during debounce", session_id
             )
             return
 
@@ -488,7 +920,8 @@ class SummarizerWorker:
         duration = session.get('duration_seconds', 0)
         if duration < min_duration:
             logger.info(
-                f"Skipping session {session_id} - duration {duration}s < {min_duration}s minimum"
+                "Skipping session %s - duration %ss < %ss minimum",
+                session_id, duration, min_duration,
             )
             return
 
@@ -508,13 +941,15 @@ class SummarizerWorker:
 
         # Delete any preview summary before generating final summary
         deleted = self.storage.delete_preview_summaries()
+        self._invalidate_last_summary()
         if deleted > 0:
-            logger.info(f"Deleted {deleted} preview summary before final summary")
+            logger.info("Deleted %d preview summary before final summary", deleted)
 
         # Clear session tracking
         self._current_session_start = None
         self._current_session_id = None
         self._last_preview_time = None
+        self._next_preview_eligible = None
 
         # Use existing summarization method with merged bounds
         self._do_summarize_time_range(logical_start, logical_end)
@@ -534,63 +969,33 @@ class SummarizerWorker:
         Returns:
             Tuple of (logical_start, logical_end) datetimes, or (None, None) if not found
         """
-        sessions = self.storage.get_recent_sessions(limit=20)
+        # Target session first, then older sessions by end_time DESC
+        sessions = self.storage.get_sessions_up_to(session_id, limit=20)
 
-        if not sessions:
+        if not sessions or sessions[0]['id'] != session_id:
             return (None, None)
 
-        # Find our session in the list
-        target_session = None
-        target_idx = None
-        for i, s in enumerate(sessions):
-            if s['id'] == session_id:
-                target_session = s
-                target_idx = i
-                break
-
-        if target_session is None:
-            # Session not in recent list, try direct lookup
-            target_session = self.storage.get_session(session_id)
-            if target_session is None:
-                return (None, None)
-            # Return its own bounds without merging
-            start = datetime.fromisoformat(target_session['start_time'].replace('Z', ''))
-            end = datetime.fromisoformat(target_session['end_time'].replace('Z', ''))
-            return (start, end)
-
-        # Parse end_time for the target session
-        logical_end = datetime.fromisoformat(
-            target_session['end_time'].replace('Z', '')
-        )
-        logical_start = datetime.fromisoformat(
-            target_session['start_time'].replace('Z', '')
-        )
-
-        # Walk backward through older sessions, merging short gaps
-        # Sessions are ordered by end_time DESC, so older sessions have higher indices
-        current_start = logical_start
-        for prev_session in sessions[target_idx + 1:]:
-            prev_end = datetime.fromisoformat(
-                prev_session['end_time'].replace('Z', '')
-            )
-            prev_start = datetime.fromisoformat(
-                prev_session['start_time'].replace('Z', '')
-            )
-
-            # Calculate gap between previous session end and current session start
-            gap_seconds = (current_start - prev_end).total_seconds()
+        # Walk backward through older sessions, merging short gaps. Gaps are
+        # measured on the precomputed seconds columns; only the two bounding
+        # timestamps are parsed.
+        target = sessions[0]
+        first = target
+        for prev in sessions[1:]:
+            # Gap between previous session end and current logical start
+            gap_seconds = first['start_seconds'] - prev['end_seconds']
 
             if 0 < gap_seconds < max_gap_seconds:
                 # Short gap - merge this session
                 logger.debug(
-                    f"Merging session {prev_session['id']} (gap={gap_seconds:.1f}s)"
+                    "Merging session %s (gap=%.1fs)", prev['id'], gap_seconds
                 )
-                logical_start = prev_start
-                current_start = prev_start
+                first = prev
             else:
                 # Real AFK gap found, stop merging
                 break
 
+        logical_start = _parse_iso(first['start_time'])
+        logical_end = _parse_iso(target['end_time'])
         return (logical_start, logical_end)
 
     def _check_unsummarized_sessions(self):
@@ -599,10 +1004,11 @@ class SummarizerWorker:
         Called once at startup to catch sessions that ended while the daemon
         was down or before the summarization could complete.
         """
-        if not self.config.config.summarization.enabled:
+        cfg = self._summarization_config()
+        if not cfg.enabled:
             return
 
-        min_duration = self.config.config.summarization.min_session_duration_seconds
+        min_duration = cfg.min_session_duration_seconds
         unsummarized = self.storage.get_sessions_without_summaries(min_duration)
 
         if not unsummarized:
@@ -611,10 +1017,10 @@ class SummarizerWorker:
 
         logger.info(f"Found {len(unsummarized)} unsummarized sessions at startup")
 
-        for session in unsummarized:
+        def recover(session: Dict):
             session_id = session['id']
-            start_time = datetime.fromisoformat(session['start_time'].replace('Z', ''))
-            end_time = datetime.fromisoformat(session['end_time'].replace('Z', ''))
+            start_time = _parse_iso(session['start_time'])
+            end_time = _parse_iso(session['end_time'])
 
             logger.info(
                 f"Recovering session {session_id}: "
@@ -626,6 +1032,18 @@ class SummarizerWorker:
             except Exception as e:
                 logger.error(f"Failed to recover session {session_id}: {e}")
 
+        workers = min(cfg.recovery_parallelism, len(unsummarized))
+        if workers <= 1:
+            for session in unsummarized:
+                recover(session)
+            return
+
+        # Each recovery mostly waits on Ollama and Tesseract, so overlapping
+        # them helps when Ollama serves parallel requests. Previous-summary
+        # context then follows completion order rather than session order.
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="recovery") as pool:
+            list(pool.map(recover, unsummarized))
+
     def _do_summarize_time_range(self, start_time: datetime, end_time: datetime):
         """Generate summary for a time range.
 
@@ -641,42 +1059,44 @@ class SummarizerWorker:
             end_time: End of the time range
         """
         logger.info(
-            f"Summarizing time range: {start_time.strftime('%H:%M')} - "
-            f"{end_time.strftime('%H:%M')}"
+            "Summarizing time range: %02d:%02d - %02d:%02d",
+            start_time.hour, start_time.minute, end_time.hour, end_time.minute,
         )
 
-        # Skip if a summary already exists for this time range (prevents duplicates)
+        cfg = self._summarization_config()
+
+        # Skip if a summary already exists for this time range (prevents
+        # duplicates) or the user was AFK for it; both checked in one query
         start_iso = start_time.isoformat()
         end_iso = end_time.isoformat()
-        if self.storage.has_summary_for_time_range(start_iso, end_iso):
+        has_summary, has_session = self.storage.get_time_range_status(
+            start_time, end_time
+        )
+        if has_summary:
             logger.info(
-                f"Skipping - summary already exists for time range "
-                f"({start_time.strftime('%H:%M')} - {end_time.strftime('%H:%M')})"
+                "Skipping - summary already exists for time range "
+                "(%02d:%02d - %02d:%02d)",
+                start_time.hour, start_time.minute, end_time.hour, end_time.minute,
             )
             return
 
         # Skip if user was AFK for the entire period
-        if not self.storage.has_active_session_in_range(start_time, end_time):
+        if not has_session:
             logger.info(
-                f"Skipping summarization - user was AFK for entire period "
-                f"({start_time.strftime('%H:%M')} - {end_time.strftime('%H:%M')})"
+                "Skipping summarization - user was AFK for entire period "
+                "(%02d:%02d - %02d:%02d)",
+                start_time.hour, start_time.minute, end_time.hour, end_time.minute,
             )
             return
 
-        # Check if summarizer is available
-        if not self.summarizer.is_available():
-            logger.error("Summarizer not available (check Ollama and Tesseract)")
-            return
-
-        # Get screenshots in the time range (may be empty if screenshots disabled)
+        # Get screenshots in the time range (may be empty if screenshots disabled).
+        # Storage returns them ordered by timestamp ASC, so no re-sort is needed.
         screenshots = self.storage.get_screenshots_in_range(start_time, end_time)
-        screenshots = sorted(screenshots, key=lambda s: s['timestamp'])
 
-        # Get focus events for the time range
-        focus_events = self.storage.get_focus_events_overlapping_range(
+        # Get focus events for the time range, durations clipped to it by SQLite
+        focus_events = self.storage.get_focus_events_clipped_to_range(
             start_time, end_time
         )
-        focus_events = self._clip_focus_event_durations(focus_events, start_time, end_time)
 
         # Skip if there's nothing to summarize
         if not screenshots and not focus_events:
@@ -685,28 +1105,35 @@ class SummarizerWorker:
 
         # Skip if focus time is below minimum threshold (avoid trivial summaries)
         total_focus_seconds = sum(e.get('duration_seconds', 0) or 0 for e in focus_events)
-        min_focus_seconds = getattr(self.config.config.summarization, 'min_focus_seconds', 60)
+        min_focus_seconds = cfg.min_focus_seconds
         if total_focus_seconds < min_focus_seconds:
             logger.info(
-                f"Skipping time range - only {total_focus_seconds:.0f}s of tracked focus "
-                f"(minimum: {min_focus_seconds}s)"
+                "Skipping time range - only %.0fs of tracked focus (minimum: %ss)",
+                total_focus_seconds, min_focus_seconds,
             )
             return
 
         logger.info(
-            f"Found {len(screenshots)} screenshots and {len(focus_events)} focus events "
-            f"in time range"
+            "Found %d screenshots and %d focus events in time range",
+            len(screenshots), len(focus_events),
         )
 
+        # Check if summarizer is available. Done only now that we know there is
+        # something to summarize, since the first access builds the summarizer.
+        if not self.summarizer.is_available():
+            logger.error("Summarizer not available (check Ollama and Tesseract)")
+            return
+
         # Get OCR texts for unique window titles (if screenshots available)
-        ocr_texts = self._gather_ocr(screenshots) if screenshots else []
+        if screenshots and cfg.include_ocr:
+            ocr_texts = self._gather_ocr(screenshots)
+        else:
+            ocr_texts = []
 
         # Get previous summary for context continuity
         previous_summary = None
-        if self.config.config.summarization.include_previous_summary:
-            last = self.storage.get_last_threshold_summary()
-            if last:
-                previous_summary = last.get('summary')
+        if cfg.include_previous_summary:
+            previous_summary = self._get_previous_summary()
 
         # Generate summary
         try:
@@ -721,20 +1148,7 @@ class SummarizerWorker:
             return
 
         # Build config snapshot
-        cfg = self.config.config.summarization
-        config_snapshot = {
-            'model': cfg.model,
-            'threshold': cfg.trigger_threshold,
-            'include_focus_context': getattr(cfg, 'include_focus_context', True),
-            'include_screenshots': getattr(cfg, 'include_screenshots', True),
-            'include_ocr': getattr(cfg, 'include_ocr', True),
-            'crop_to_window': cfg.crop_to_window,
-            'include_previous_summary': cfg.include_previous_summary,
-            'max_samples': cfg.max_samples,
-            'sample_interval_minutes': cfg.sample_interval_minutes,
-            'focus_weighted_sampling': cfg.focus_weighted_sampling,
-            'frequency_minutes': cfg.frequency_minutes,
-        }
+        config_snapshot = self._config_snapshot_for(cfg)
 
         # Save to database (reuse ISO strings computed earlier for dedup check)
         summary_id = self.storage.save_threshold_summary(
@@ -742,7 +1156,7 @@ class SummarizerWorker:
             end_time=end_iso,
             summary=summary,
             screenshot_ids=[s['id'] for s in screenshots],
-            model=self.config.config.summarization.model,
+            model=cfg.model,
             config_snapshot=config_snapshot,
             inference_ms=inference_ms,
             prompt_text=prompt_text,
@@ -751,6 +1165,7 @@ class SummarizerWorker:
             confidence=confidence,
         )
 
+        self._note_saved_summary(end_iso, summary)
         logger.info(f"Saved summary {summary_id} (conf={confidence:.2f}): {summary[:80]}...")
 
     def _do_summarize_screenshots(self, screenshots: List[Dict]):
@@ -764,8 +1179,21 @@ class SummarizerWorker:
         if not screenshots:
             return
 
-        # Sort by timestamp (ascending) for chronological narrative
-        screenshots = sorted(screenshots, key=lambda s: s['timestamp'])
+        cfg = self._summarization_config()
+
+        if len(screenshots) == 1 and cfg.fast_single_shot:
+            # Single screenshot: nothing to sort, and its time range has zero
+            # width, so widen it by half a slot either side to get focus context
+            ts = screenshots[0]['timestamp']
+            half_slot_seconds = cfg.frequency_minutes * 30
+            focus_start_ts, focus_end_ts = ts - half_slot_seconds, ts + half_slot_seconds
+        else:
+            # Sort by timestamp (ascending) for chronological narrative. The batch
+            # is owned by this task, so sort in place rather than copying it;
+            # batches usually arrive in order, which timsort handles in one pass.
+            screenshots.sort(key=itemgetter('timestamp'))
+            focus_start_ts = screenshots[0]['timestamp']
+            focus_end_ts = screenshots[-1]['timestamp']
 
         logger.info(f"Summarizing batch of {len(screenshots)} screenshots...")
 
@@ -774,18 +1202,22 @@ class SummarizerWorker:
             logger.error("Summarizer not available (check Ollama and Tesseract)")
             return
 
-        # Gather focus events (app/window usage breakdown)
-        focus_events = self._gather_focus_events(screenshots)
+        # Gather focus events (app/window usage breakdown) only if something
+        # consumes them: the prompt context or focus-weighted sampling
+        if _wants_focus_events(cfg):
+            focus_events = self._gather_focus_events(
+                screenshots, start_ts=focus_start_ts, end_ts=focus_end_ts
+            )
+        else:
+            focus_events = []
 
         # Get OCR texts for unique window titles
-        ocr_texts = self._gather_ocr(screenshots)
+        ocr_texts = self._gather_ocr(screenshots) if cfg.include_ocr else []
 
         # Get previous summary for context continuity
         previous_summary = None
-        if self.config.config.summarization.include_previous_summary:
-            last = self.storage.get_last_threshold_summary()
-            if last:
-                previous_summary = last.get('summary')
+        if cfg.include_previous_summary:
+            previous_summary = self._get_previous_summary()
 
         # Generate summary
         try:
@@ -800,19 +1232,7 @@ class SummarizerWorker:
             return
 
         # Build config snapshot
-        cfg = self.config.config.summarization
-        config_snapshot = {
-            'model': cfg.model,
-            'threshold': cfg.trigger_threshold,
-            'include_focus_context': getattr(cfg, 'include_focus_context', True),
-            'include_screenshots': getattr(cfg, 'include_screenshots', True),
-            'include_ocr': getattr(cfg, 'include_ocr', True),
-            'crop_to_window': cfg.crop_to_window,
-            'include_previous_summary': cfg.include_previous_summary,
-            'max_samples': cfg.max_samples,
-            'sample_interval_minutes': cfg.sample_interval_minutes,
-            'focus_weighted_sampling': cfg.focus_weighted_sampling,
-        }
+        config_snapshot = self._config_snapshot_for(cfg)
 
         # Get timestamps
         first_ts = screenshots[0]['timestamp']
@@ -826,7 +1246,7 @@ class SummarizerWorker:
             end_time=end_iso,
             summary=summary,
             screenshot_ids=[s['id'] for s in screenshots],
-            model=self.config.config.summarization.model,
+            model=cfg.model,
             config_snapshot=config_snapshot,
             inference_ms=inference_ms,
             prompt_text=prompt_text,
@@ -835,6 +1255,7 @@ class SummarizerWorker:
             confidence=confidence,
         )
 
+        self._note_saved_summary(end_iso, summary)
         logger.info(f"Saved summary {summary_id} (conf={confidence:.2f}): {summary[:80]}...")
 
     def _do_regenerate(self, summary_id: int):
@@ -845,6 +1266,8 @@ class SummarizerWorker:
         """
         logger.info(f"Regenerating summary {summary_id}...")
 
+        cfg = self._summarization_config()
+
         # Get the original summary
         old_summary = self.storage.get_threshold_summary(summary_id)
         if not old_summary:
@@ -853,11 +1276,7 @@ class SummarizerWorker:
 
         # Get the screenshots
         screenshot_ids = old_summary['screenshot_ids']
-        screenshots = []
-        for sid in screenshot_ids:
-            s = self.storage.get_screenshot_by_id(sid)
-            if s:
-                screenshots.append(s)
+        screenshots = self.storage.get_screenshots_by_ids(screenshot_ids)
 
         if not screenshots:
             logger.error(f"No screenshots found for summary {summary_id}")
@@ -869,8 +1288,8 @@ class SummarizerWorker:
             return
 
         # Use current config (may differ from original)
-        ocr_texts = self._gather_ocr(screenshots)
-        focus_events = self._gather_focus_events(screenshots)
+        ocr_texts = self._gather_ocr(screenshots) if cfg.include_ocr else []
+        focus_events = self._gather_focus_events(screenshots) if _wants_focus_events(cfg) else []
 
         # Don't use previous summary for regeneration
         start_time = time.time()
@@ -886,25 +1305,16 @@ class SummarizerWorker:
             return
 
         # Build config snapshot
-        cfg = self.config.config.summarization
-        config_snapshot = {
-            'model': cfg.model,
-            'threshold': cfg.trigger_threshold,
-            'include_focus_context': getattr(cfg, 'include_focus_context', True),
-            'include_screenshots': getattr(cfg, 'include_screenshots', True),
-            'include_ocr': getattr(cfg, 'include_ocr', True),
-            'crop_to_window': cfg.crop_to_window,
-            'include_previous_summary': False,  # Not used for regeneration
-            'max_samples': cfg.max_samples,
-            'sample_interval_minutes': cfg.sample_interval_minutes,
-            'focus_weighted_sampling': cfg.focus_weighted_sampling,
-        }
+        config_snapshot = dict(
+            self._config_snapshot_for(cfg),
+            include_previous_summary=False,  # Not used for regeneration
+        )
 
         # Update existing summary in-place
         success = self.storage.update_threshold_summary(
             summary_id=summary_id,
             summary=summary,
-            model=self.config.config.summarization.model,
+            model=cfg.model,
             config_snapshot=config_snapshot,
             inference_ms=inference_ms,
             prompt_text=prompt_text,
@@ -914,10 +1324,47 @@ class SummarizerWorker:
         )
 
         if success:
+            # The regenerated summary may be the latest one
+            self._invalidate_last_summary()
             logger.info(f"Regenerated summary {summary_id} (conf={confidence:.2f}): {summary[:100]}...")
         else:
             logger.error(f"Failed to update summary {summary_id} - not found")
 
+    def _get_previous_summary(self) -> Optional[str]:
+        """Return the text of the most recent summary, for context continuity.
+
+        Cached so that a backfill of many ranges does not re-query the same
+        row for every range; see _note_saved_summary().
+
+        Returns:
+            Summary text, or None if no summaries exist
+        """
+        with self._last_summary_lock:
+            if not self._last_summary_known:
+                last = self.storage.get_last_threshold_summary()
+                self._last_summary = (last['end_time'], last.get('summary')) if last else None
+                self._last_summary_known = True
+            return self._last_summary[1] if self._last_summary else None
+
+    def _invalidate_last_summary(self):
+        """Make the next _get_previous_summary() re-read the latest summary."""
+        with self._last_summary_lock:
+            self._last_summary_known = False
+
+    def _note_saved_summary(self, end_time: str, summary: str):
+        """Update the previous-summary cache after saving a new summary.
+
+        Args:
+            end_time: ISO end time of the saved summary
+            summary: Summary text
+        """
+        # Mirrors get_last_threshold_summary's ORDER BY end_time DESC
+        with self._last_summary_lock:
+            if self._last_summary_known and (
+                self._last_summary is None or end_time >= self._last_summary[0]
+            ):
+                self._last_summary = (end_time, summary)
+
     def _gather_ocr(self, screenshots: List[Dict]) -> List[Dict]:
         """Gather OCR texts for unique window titles.
 
@@ -927,43 +1374,114 @@ class SummarizerWorker:
         Returns:
             List of dicts with window_title and ocr_text
         """
+        cfg = self._summarization_config()
+
         # Skip OCR if not enabled in settings
-        if not getattr(self.config.config.summarization, 'include_ocr', True):
+        if not cfg.include_ocr:
             return []
 
-        ocr_texts = []
-        seen_titles = set()
-        data_dir = Path(self.config.config.storage.data_dir).expanduser()
+        screenshots_root = os.path.join(
+            os.path.expanduser(self.config.config.storage.data_dir), "screenshots"
+        )
+        crop_enabled = cfg.crop_to_window
+        summarizer = self.summarizer
 
+        # Pick one screenshot per unique window title, in first-seen order
+        first_by_title = {}
         for s in screenshots:
             title = s.get('window_title')
-            if not title or title in seen_titles:
-                continue
-
-            seen_titles.add(title)
+            if title:
+                first_by_title.setdefault(_ocr_title_key(title), s)
 
+        jobs = []  # (title, screenshot_id, filepath, cropped)
+        for s in first_by_title.values():
+            title = s['window_title']
             try:
                 # Get screenshot path
-                filepath = data_dir / "screenshots" / s['filepath']
+                filepath = os.path.join(screenshots_root, s['filepath'])
+                cropped = False
 
                 # Use cropped version if available and enabled
-                if self.config.config.summarization.crop_to_window:
-                    cropped_path = self.summarizer.get_cropped_path(s)
-                    if cropped_path and Path(cropped_path).exists():
+                if crop_enabled:
+                    cropped_path = summarizer.get_cropped_path(s)
+                    if cropped_path and os.path.exists(cropped_path):
                         filepath = cropped_path
-
-                # Extract OCR
-                ocr_text = self.summarizer.extract_ocr(str(filepath))
-                ocr_texts.append({
-                    'window_title': title,
-                    'ocr_text': ocr_text,
-                })
+                        cropped = True
             except Exception as e:
                 logger.debug(f"OCR failed for '{title}': {e}")
+                continue
+
+            jobs.append((title, s.get('id'), filepath, cropped))
+
+        if not jobs:
+            return []
+
+        # Screenshots are immutable, so text extracted for an earlier summary
+        # (or a regeneration) can be reused instead of re-running Tesseract.
+        cached = {}
+        for cropped in (False, True):
+            ids = [sid for _, sid, _, c in jobs if c == cropped and sid is not None]
+            if ids:
+                try:
+                    cached[cropped] = self.storage.get_ocr_texts(ids, cropped)
+                except Exception as e:
+                    logger.debug(f"OCR cache lookup failed: {e}")
+
+        # Each OCR call waits on a Tesseract subprocess, so run the misses
+        # concurrently; results are collected in job order. Screenshots whose
+        # file is gone are dropped here rather than failing inside the pool.
+        misses = []
+        for title, sid, filepath, cropped in jobs:
+            if sid in cached.get(cropped, {}):
+                continue
+            # Cropped paths were already checked when they were chosen
+            if not cropped and not os.path.exists(filepath):
+                logger.debug("Skipping OCR for '%s': %s is missing", title, filepath)
+                continue
+            misses.append((title, filepath))
+        futures = {}
+        if misses:
+            with self._summarizer_lock:
+                if self._ocr_pool is None:
+                    self._ocr_pool = ThreadPoolExecutor(
+                        max_workers=_OCR_WORKERS, thread_name_prefix="ocr"
+                    )
+                ocr_pool = self._ocr_pool
+            for title, filepath in misses:
+                futures[title] = ocr_pool.submit(summarizer.extract_ocr, filepath)
+
+        ocr_texts = []
+        new_texts = {False: {}, True: {}}
+        for title, sid, _, cropped in jobs:
+            if title not in futures:
+                text = cached.get(cropped, {}).get(sid)
+                if text is None:
+                    continue
+            else:
+                try:
+                    text = futures[title].result()
+                except Exception as e:
+                    logger.debug(f"OCR failed for '{title}': {e}")
+                    continue
+                # Empty results may be transient failures; retry them next time
+                if text and sid is not None:
+                    new_texts[cropped][sid] = text
+            ocr_texts.append({'window_title': title, 'ocr_text': text})
+
+        for cropped, texts in new_texts.items():
+            try:
+                self.storage.save_ocr_texts(texts, cropped)
+            except Exception as e:
+                logger.debug(f"Failed to cache OCR text: {e}")
 
         return ocr_texts
 
-    def _gather_focus_events(self, screenshots: List[Dict]) -> List[Dict]:
+    def _gather_focus_events(
+        self,
+        screenshots: List[Dict],
+        start_ts: Optional[float] = None,
+        end_ts: Optional[float] = None,
+    ) -> List[Dict]:
         """Gather focus events for the time range of screenshots.
 
         Gets all focus events that overlap with the screenshot time range
@@ -971,109 +1489,45 @@ class SummarizerWorker:
 
         Args:
             screenshots: List of screenshot dicts with timestamps
+            start_ts: Earliest screenshot timestamp, if already known
+                (e.g. the caller has sorted screenshots)
+            end_ts: Latest screenshot timestamp, if already known
 
         Returns:
             List of focus event dicts with durations clipped to the query range
         """
-        if not screenshots:
+        if not screenshots or not _wants_focus_events(self._summarization_config()):
             return []
 
         try:
-            # Get time range from screenshots
-            timestamps = [s.get('timestamp', 0) for s in screenshots]
-            start_ts = min(timestamps)
-            end_ts = max(timestamps)
+            # Get time range from screenshots unless the caller supplied it
+            if start_ts is None or end_ts is None:
+                timestamps = [s.get('timestamp', 0) for s in screenshots]
+                start_ts = min(timestamps)
+                end_ts = max(timestamps)
 
             # Convert to datetime for storage query
             start_dt = datetime.fromtimestamp(start_ts)
             end_dt = datetime.fromtimestamp(end_ts)
 
-            # Get focus events that overlap with the range
-            focus_events = self.storage.get_focus_events_overlapping_range(
+            # Get focus events that overlap with the range, durations
+            # clipped to the actual query range
+            clipped_events = self.storage.get_focus_events_clipped_to_range(
                 start_dt, end_dt
             )
 
-            # Clip durations to the actual query range
-            clipped_events = self._clip_focus_event_durations(
-                focus_events, start_dt, end_dt
+            logger.info(
+                "Found %d focus events for time range (%02d:%02d - %02d:%02d)",
+                len(clipped_events),
+                start_dt.hour, start_dt.minute, end_dt.hour, end_dt.minute,
             )
-
-            logger.info(f"Found {len(clipped_events)} focus events for time range "
-                       f"({start_dt.strftime('%H:%M')} - {end_dt.strftime('%H:%M')})")
             return clipped_events
 
         except Exception as e:
             logger.warning(f"Failed to gather focus events: {e}")
             return []
 
-    def _clip_focus_event_durations(
-        self,
-        events: List[Dict],
-        range_start: datetime,
-        range_end: datetime
-    ) -> List[Dict]:
-        """Clip focus event durations to the specified time range.
-
-        For events that extend beyond the query range, adjusts duration_seconds
-        to only count time within the range.
-
-        Args:
-            events: List of focus event dicts
-            range_start: Start of the query range
-            range_end: End of the query range
-
-        Returns:
-            List of events with clipped durations
-        """
-        clipped = []
-        for event in events:
-            event_copy = dict(event)
-
-            # Parse event times
-            event_start_str = event.get('start_time', '')
-            event_end_str = event.get('end_time', '')
-
-            try:
-                # Handle ISO format with optional microseconds
-                if 'T' in event_start_str:
-                    event_start = datetime.fromisoformat(event_start_str.replace('Z', '+00:00'))
-                else:
-                    event_start = datetime.strptime(event_start_str, '%Y-%m-%d %H:%M:%S')
-
-                if event_end_str:
-                    if 'T' in event_end_str:
-                        event_end = datetime.fromisoformat(event_end_str.replace('Z', '+00:00'))
-                    else:
-                        event_end = datetime.strptime(event_end_str, '%Y-%m-%d %H:%M:%S')
-                else:
-                    # Ongoing event - use range_end as the effective end
-                    event_end = range_end
-
-                # Remove timezone info for comparison if present
-                if event_start.tzinfo:
-                    event_start = event_start.replace(tzinfo=None)
-                if event_end.tzinfo:
-                    event_end = event_end.replace(tzinfo=None)
-
-                # Calculate overlap
-                overlap_start = max(event_start, range_start)
-                overlap_end = min(event_end, range_end)
-
-                if overlap_start < overlap_end:
-                    # There is overlap - calculate clipped duration
-                    clipped_duration = (overlap_end - overlap_start).total_seconds()
-                    event_copy['duration_seconds'] = clipped_duration
-                    clipped.append(event_copy)
-                # If no overlap, skip the event
-
-            except (ValueError, TypeError) as e:
-                # If we can't parse times, include event with original duration
-                logger.debug(f"Could not parse focus event times: {e}")
-                clipped.append(event_copy)
-
-        return clipped
-
-    def _maybe_generate_preview(self, now: datetime):
+    def _maybe_generate_preview(self, now: datetime, cfg: "SummarizationConfig"):
         """Generate or update preview summary for active session if due.
 
         Called from the run loop. Checks if enough time has passed since
@@ -1082,16 +1536,20 @@ class SummarizerWorker:
 
         Args:
             now: Current datetime
+            cfg: Summarization settings snapshot for this loop iteration
         """
+        # Fast path: no active session, or no preview can be due yet
+        if self._next_preview_eligible is None or now < self._next_preview_eligible:
+            return
+
         # Only run if summarization is enabled
-        if not self.config.config.summarization.enabled:
+        if not cfg.enabled:
             return
 
         # Only if we have an active session
         if self._current_session_start is None:
             return
 
-        cfg = self.config.config.summarization
         preview_interval = cfg.preview_interval_minutes
         min_duration = cfg.min_session_duration_seconds
 
@@ -1167,11 +1625,12 @@ class SummarizerWorker:
                 f"{len(focus_events)} focus events"
             )
 
+            cfg = self._summarization_config()
+
             # Gather OCR texts for unique window titles
-            ocr_texts = self._gather_ocr(screenshots)
+            ocr_texts = self._gather_ocr(screenshots) if cfg.include_ocr else []
 
             # Generate summary
-            cfg = self.config.config.summarization
             try:
                 summary_text, inference_ms, prompt_text, screenshot_ids, explanation, tags, confidence = summarizer.summarize_session(
                     screenshots=screenshots,
@@ -1186,13 +1645,7 @@ class SummarizerWorker:
             # Check for existing preview to update
             existing_preview = self.storage.get_current_preview_summary()
 
-            config_snapshot = {
-                "model": cfg.model,
-                "max_samples": cfg.max_samples,
-                "include_focus_context": cfg.include_focus_context,
-                "include_screenshots": cfg.include_screenshots,
-                "include_ocr": cfg.include_ocr,
-            }
+            config_snapshot = self._config_snapshot_for(cfg)
 
             if existing_preview:
                 # Update existing preview
@@ -1233,13 +1686,15 @@ class SummarizerWorker:
                 )
 
             self._last_preview_time = now
+            self._next_preview_eligible = now + timedelta(minutes=cfg.preview_interval_minutes)
+            self._invalidate_last_summary()  # Previews count as the latest summary
 
         except Exception as e:
             logger.error(f"Preview generation failed: {e}", exc_info=True)
         finally:
             self._current_task = None
 
-    def _maybe_generate_daily_reports(self, now: datetime):
+    def _maybe_generate_daily_reports(self, now: datetime, cfg: "SummarizationConfig"):
         """Generate daily report for yesterday if not already generated.
 
         Called from the run loop. Checks if we've crossed midnight and
@@ -1247,9 +1702,10 @@ class SummarizerWorker:
 
         Args:
             now: Current datetime
+            cfg: Summarization settings snapshot for this loop iteration
         """
         # Only run if summarization is enabled (reuse the same config flag)
-        if not self.config.config.summarization.enabled:
+        if not cfg.enabled:
             return
 
         # Get yesterday's date string
@@ -1271,8 +1727,7 @@ class SummarizerWorker:
         self._current_task = 'daily_report'
 
         try:
-            from .reports import ReportGenerator
-            generator = ReportGenerator(self.storage, self.summarizer, self.config)
+            generator = self._get_report_generator()
             result = generator.generate_daily_report(yesterday)
 
             if result:
@@ -1288,7 +1743,7 @@ class SummarizerWorker:
         finally:
             self._current_task = None
 
-    def _maybe_generate_weekly_reports(self, now: datetime):
+    def _maybe_generate_weekly_reports(self, now: datetime, cfg: "SummarizationConfig"):
         """Generate weekly report for last week if not already generated.
 
         Called from the run loop. Checks if we're on Sunday and if so,
@@ -1296,13 +1751,16 @@ class SummarizerWorker:
 
         Args:
             now: Current datetime
+            cfg: Summarization settings snapshot for this loop iteration
         """
         # Only run if summarization is enabled
-        if not self.config.config.summarization.enabled:
+        if not cfg.enabled:
             return
 
         # Only generate on Sunday after 00:05
-        if now.weekday() != 6 or now.hour == 0 and now.minute < 5:
+        if now.weekday() != 6:
+            return
+        if now.hour == 0 and now.minute < 5:
             return
 
         # Get last week's ISO week string
@@ -1325,8 +1783,7 @@ class SummarizerWorker:
         self._current_task = 'weekly_report'
 
         try:
-            from .reports import ReportGenerator
-            generator = ReportGenerator(self.storage, self.summarizer, self.config)
+            generator = self._get_report_generator()
             result = generator.generate_weekly_report(week_str)
 
             if result:
@@ -1341,7 +1798,7 @@ class SummarizerWorker:
         finally:
             self._current_task = None
 
-    def _maybe_generate_monthly_reports(self, now: datetime):
+    def _maybe_generate_monthly_reports(self, now: datetime, cfg: "SummarizationConfig"):
         """Generate monthly report for last month if not already generated.
 
         Called from the run loop. Checks if we're on the 1st of the month
@@ -1349,13 +1806,16 @@ class SummarizerWorker:
 
         Args:
             now: Current datetime
+            cfg: Summarization settings snapshot for this loop iteration
         """
         # Only run if summarization is enabled
-        if not self.config.config.summarization.enabled:
+        if not cfg.enabled:
             return
 
         # Only generate on the 1st after 00:10
-        if now.day != 1 or now.hour == 0 and now.minute < 10:
+        if now.day != 1:
+            return
+        if now.hour == 0 and now.minute < 10:
             return
 
         # Get last month's string
@@ -1377,8 +1837,7 @@ class SummarizerWorker:
         self._current_task = 'monthly_report'
 
         try:
-            from .reports import ReportGenerator
-            generator = ReportGenerator(self.storage, self.summarizer, self.config)
+            generator = self._get_report_generator()
             result = generator.generate_monthly_report(month_str)
 
             if result:
@@ -1399,18 +1858,20 @@ class SummarizerWorker:
         Backfills missing daily, weekly, and monthly reports for recent periods.
         This runs once when the worker starts.
         """
-        if not self.config.config.summarization.enabled:
+        cfg = self._summarization_config()
+        if not cfg.enabled:
             return
 
         logger.info("Running startup backfill for missing reports...")
         self._current_task = 'backfill'
 
         try:
-            from .reports import ReportGenerator
-            generator = ReportGenerator(self.storage, self.summarizer, self.config)
+            generator = self._get_report_generator()
 
             # Backfill daily reports for last 7 days
-            daily_count = generator.generate_missing_daily_reports(days_back=7)
+            daily_count = generator.generate_missing_daily_reports(
+                days_back=7, max_workers=cfg.recovery_parallelism
+            )
             if daily_count > 0:
                 logger.info(f"Backfilled {daily_count} daily reports")
 
@@ -1442,8 +1903,8 @@ class SummarizerWorker:
             period_type: 'daily', 'weekly', or 'monthly'
             period_date: Period identifier (e.g., '2024-12-30', '2024-W52', '2024-12')
         """
-        self._pending_queue.put(('regenerate_report', (period_type, period_date)))
-        logger.info(f"Queued {period_type} report {period_date} for regeneration")
+        if self._enqueue(('regenerate_report', (period_type, period_date))):
+            logger.info(f"Queued {period_type} report {period_date} for regeneration")
 
     def _do_regenerate_report(self, period_type: str, period_date: str):
         """Regenerate a hierarchical report with current settings.
@@ -1455,8 +1916,7 @@ class SummarizerWorker:
         logger.info(f"Regenerating {period_type} report for {period_date}...")
 
         try:
-            from .reports import ReportGenerator
-            generator = ReportGenerator(self.storage, self.summarizer, self.config)
+            generator = self._get_report_generator()
 
             if period_type == 'daily':
                 result = generator.generate_daily_report(period_date, is_regeneration=True)
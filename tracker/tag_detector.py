@@ -4,9 +4,12 @@ This module analyzes focus events and classifies them into meaningful
 activity categories (tags) based on the app name and window title patterns.
 """
 
+import functools
+import heapq
 import re
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -15,6 +18,17 @@ class TagRule:
     apps: List[str]  # App name patterns (case-insensitive substring match)
     windows: List[str]  # Window title patterns (regex patterns)
     color: str  # CSS color for visualization
+    # Derived in __post_init__: window patterns as one case-insensitive
+    # alternation (None if there are none) and lowercased app patterns
+    window_re: Optional[re.Pattern] = field(init=False, repr=False, compare=False)
+    lower_apps: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.window_re = (
+            re.compile('|'.join(f'(?:{p})' for p in self.windows), re.IGNORECASE)
+            if self.windows else None
+        )
+        self.lower_apps = tuple(a.lower() for a in self.apps)
 
 
 # Tag detection rules - order matters for priority
@@ -109,6 +123,23 @@ TAG_RULES: Dict[str, TagRule] = {
 DEFAULT_TAG = '#other'
 DEFAULT_TAG_COLOR = '#94a3b8'  # Gray
 
+# Lookup tables derived from TAG_RULES, which must not be modified after import.
+# Tag -> color lookups, including the default tag, built once from TAG_RULES
+_TAG_COLORS: Dict[str, str] = {tag: rule.color for tag, rule in TAG_RULES.items()}
+_TAG_COLORS[DEFAULT_TAG] = DEFAULT_TAG_COLOR
+_ALL_TAGS = tuple(_TAG_COLORS)
+
+# Fallback tags only match on app name, after every other rule has been tried
+_FALLBACK_TAGS = ('#terminal', '#browsing')
+
+# TAG_RULES flattened for detect_tag: (tag, window regex, lowercased app keywords)
+_CONTENT_RULES = [
+    (tag, rule.window_re, rule.lower_apps)
+    for tag, rule in TAG_RULES.items()
+    if tag not in _FALLBACK_TAGS
+]
+_FALLBACK_RULES = [(tag, TAG_RULES[tag].lower_apps) for tag in _FALLBACK_TAGS]
+
 
 def detect_tag(app_name: Optional[str], window_title: Optional[str]) -> str:
     """Detect the most appropriate tag for a focus event.
@@ -123,30 +154,34 @@ def detect_tag(app_name: Optional[str], window_title: Optional[str]) -> str:
     if not app_name and not window_title:
         return DEFAULT_TAG
 
-    app_lower = (app_name or '').lower()
-    window_lower = (window_title or '').lower()
+    return _detect_tag_lower((app_name or '').lower(), (window_title or '').lower())
 
+
+@functools.lru_cache(maxsize=4096)
+def _detect_tag_lower(app_lower: str, window_lower: str) -> str:
+    """Match lowercased app/window strings against TAG_RULES.
+
+    Memoized: a day's focus events repeat the same (app, window) pairs many
+    times. TAG_RULES is treated as fixed after import: the lookup tables
+    above and each TagRule's compiled patterns are built once, so runtime
+    edits to TAG_RULES are not picked up, even after cache_clear().
+    """
     # First pass: check for specific content-based tags (research, meetings, etc.)
     # These take priority over app-based detection
-    for tag, rule in TAG_RULES.items():
-        if tag in ('#browsing', '#terminal'):  # Skip fallback tags in first pass
-            continue
-
+    for tag, window_re, apps in _CONTENT_RULES:
         # Check window title patterns first (more specific)
-        for pattern in rule.windows:
-            if re.search(pattern, window_lower, re.IGNORECASE):
-                return tag
+        if window_re is not None and window_re.search(window_lower):
+            return tag
 
         # Then check app name patterns
-        for app_pattern in rule.apps:
-            if app_pattern.lower() in app_lower:
+        for app_pattern in apps:
+            if app_pattern in app_lower:
                 return tag
 
     # Second pass: app-based fallbacks (terminal, browsing)
-    for tag in ('#terminal', '#browsing'):
-        rule = TAG_RULES[tag]
-        for app_pattern in rule.apps:
-            if app_pattern.lower() in app_lower:
+    for tag, apps in _FALLBACK_RULES:
+        for app_pattern in apps:
+            if app_pattern in app_lower:
                 return tag
 
     return DEFAULT_TAG
@@ -161,21 +196,17 @@ def get_tag_color(tag: str) -> str:
     Returns:
         CSS color string (e.g., '#6366f1').
     """
-    if tag in TAG_RULES:
-        return TAG_RULES[tag].color
-    return DEFAULT_TAG_COLOR
+    return _TAG_COLORS.get(tag, DEFAULT_TAG_COLOR)
 
 
 def get_all_tags() -> List[str]:
     """Get all defined tags in priority order."""
-    return list(TAG_RULES.keys()) + [DEFAULT_TAG]
+    return list(_ALL_TAGS)
 
 
 def get_tag_colors() -> Dict[str, str]:
     """Get a mapping of all tags to their colors."""
-    colors = {tag: rule.color for tag, rule in TAG_RULES.items()}
-    colors[DEFAULT_TAG] = DEFAULT_TAG_COLOR
-    return colors
+    return dict(_TAG_COLORS)
 
 
 @dataclass
@@ -198,14 +229,20 @@ def tag_focus_events(focus_events: List[Dict]) -> Dict[str, List[TaggedActivity]
         Dict mapping tags to lists of TaggedActivity objects.
     """
     tagged: Dict[str, List[TaggedActivity]] = {}
+    # (app, window) pairs repeat heavily, so classify each unique pair once
+    tags_by_window: Dict[Tuple[str, str], Tuple[str, str]] = {}
 
     for event in focus_events:
         app_name = event.get('app_name') or ''
         window_title = event.get('window_title') or ''
         duration = event.get('duration_seconds') or 0
 
-        tag = detect_tag(app_name, window_title)
-        color = get_tag_color(tag)
+        key = (app_name, window_title)
+        tag_and_color = tags_by_window.get(key)
+        if tag_and_color is None:
+            tag = detect_tag(app_name, window_title)
+            tag_and_color = tags_by_window[key] = (tag, get_tag_color(tag))
+        tag, color = tag_and_color
 
         activity = TaggedActivity(
             tag=tag,
@@ -241,49 +278,47 @@ def get_tag_breakdown(focus_events: List[Dict]) -> List[TagBreakdown]:
     Returns:
         List of TagBreakdown objects sorted by total time descending.
     """
-    # Group events by tag
-    tag_events = tag_focus_events(focus_events)
+    # Aggregate time by tag and window, plus the overall total for
+    # percentages, in a single pass over the events
+    total_time = 0
+    tag_windows: Dict[str, Dict[Tuple[str, str], float]] = {}
+    # Per unique window, the window_times dict of its tag (classified once)
+    tag_window_times: Dict[Tuple[str, str], Dict[Tuple[str, str], float]] = {}
+    for event in focus_events:
+        key = (event.get('app_name') or '', event.get('window_title') or '')
+        duration = event.get('duration_seconds') or 0
+        total_time += duration
 
-    # Calculate total time for percentage calculation
-    total_time = sum(
-        event.get('duration_seconds') or 0
-        for event in focus_events
-    )
+        window_times = tag_window_times.get(key)
+        if window_times is None:
+            window_times = tag_windows.setdefault(detect_tag(*key), {})
+            tag_window_times[key] = window_times
+        window_times[key] = window_times.get(key, 0) + duration
 
     if total_time == 0:
         return []
 
     breakdowns = []
 
-    for tag, activities in tag_events.items():
-        # Aggregate time by window
-        window_times: Dict[Tuple[str, str], float] = {}
-        for activity in activities:
-            key = (activity.app_name, activity.window_title)
-            window_times[key] = window_times.get(key, 0) + activity.duration_seconds
+    for tag, window_times in tag_windows.items():
+        # Top 10 windows by time descending (ties keep first-seen order)
+        top_windows = heapq.nlargest(10, window_times.items(), key=itemgetter(1))
 
-        # Sort windows by time descending
-        sorted_windows = sorted(
-            [
-                {
-                    'app_name': app_name,
-                    'window_title': window_title,
-                    'duration_seconds': duration
-                }
-                for (app_name, window_title), duration in window_times.items()
-            ],
-            key=lambda x: x['duration_seconds'],
-            reverse=True
-        )
-
-        tag_total = sum(a.duration_seconds for a in activities)
+        tag_total = sum(window_times.values())
 
         breakdowns.append(TagBreakdown(
             tag=tag,
             total_seconds=tag_total,
             percentage=(tag_total / total_time) * 100,
             color=get_tag_color(tag),
-            windows=sorted_windows[:10]  # Limit to top 10 windows per tag
+            windows=[
+                {
+                    'app_name': app_name,
+                    'window_title': window_title,
+                    'duration_seconds': duration
+                }
+                for (app_name, window_title), duration in top_windows
+            ],
         ))
 
     # Sort by total time descending
@@ -17,7 +17,7 @@ import os
 import subprocess
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Optional, List, Set
+from typing import Dict, Optional, List, Set
 
 logger = logging.getLogger(__name__)
 
@@ -108,24 +108,106 @@ def is_terminal_app(app_name: Optional[str]) -> bool:
     return app_name.lower() in TERMINAL_APPS
 
 
-def _find_shell_descendants(pids: List[int]) -> List[int]:
+def _read_small(path: str) -> Optional[bytes]:
+    """Read a small /proc file with raw file descriptor calls.
+
+    Skips the pathlib object, the exists() stat and the buffered file
+    object: a missing process simply fails the open. Most /proc files fit
+    in a single 4 KiB read; longer ones (environ, cmdline) are read on
+    until a short read.
+
+    Args:
+        path: Path of the /proc file.
+
+    Returns:
+        The file contents, or None if it can't be read (e.g. the process
+        has exited or belongs to another user).
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        data = os.read(fd, 4096)
+        if len(data) < 4096:
+            return data
+        chunks = [data]
+        while len(data) == 4096:
+            data = os.read(fd, 4096)
+            chunks.append(data)
+        return b''.join(chunks)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+class _ProcSnapshot:
+    """Per-call cache of /proc reads.
+
+    One introspection pass checks the same PIDs several times (shell
+    detection, tmux, SSH, foreground search, shell ancestry). The snapshot
+    reads each PID's comm, parent PID and tmux membership lazily, at most
+    once, and shares them between those helpers. PIDs get reused, so a
+    snapshot must only live for a single get_terminal_context() call.
+    """
+
+    def __init__(self):
+        self._comms: Dict[int, Optional[str]] = {}
+        self._ppids: Dict[int, Optional[int]] = {}
+        self._in_tmux: Dict[int, bool] = {}
+
+    def comm(self, pid: int) -> Optional[str]:
+        """Get the process name, or None if the process is gone."""
+        try:
+            return self._comms[pid]
+        except KeyError:
+            pass
+        data = _read_small(f"/proc/{pid}/comm")
+        comm = data.rstrip(b"\n").decode('utf-8', errors='replace') if data is not None else None
+        self._comms[pid] = comm
+        return comm
+
+    def ppid(self, pid: int) -> Optional[int]:
+        """Get the parent PID, or None if it can't be read."""
+        try:
+            return self._ppids[pid]
+        except KeyError:
+            pass
+        stat = _read_small(f"/proc/{pid}/stat")
+        ppid = None
+        if stat is not None:
+            # stat format: pid (comm) state ppid ...
+            # Need to handle comm with spaces/parens
+            close_paren = stat.rfind(b')')
+            try:
+                ppid = int(stat[close_paren+2:].split()[1])
+            except (ValueError, IndexError):
+                pass
+        self._ppids[pid] = ppid
+        return ppid
+
+    def in_tmux(self, pid: int) -> bool:
+        """Check whether the process has the TMUX environment variable."""
+        try:
+            return self._in_tmux[pid]
+        except KeyError:
+            result = self._in_tmux[pid] = _process_in_tmux(pid)
+            return result
+
+
+def _find_shell_descendants(pids: List[int], snapshot: Optional[_ProcSnapshot] = None) -> List[int]:
     """Find all shell processes in the descendant list.
 
     Args:
         pids: List of process IDs to check.
+        snapshot: Cached /proc reads to share with other helpers.
 
     Returns:
         List of PIDs that are shell processes.
     """
-    shells = []
-    for pid in pids:
-        try:
-            comm = Path(f"/proc/{pid}/comm").read_text().strip()
-            if comm in SHELL_NAMES:
-                shells.append(pid)
-        except OSError:
-            continue
-    return shells
+    snapshot = snapshot or _ProcSnapshot()
+    return [pid for pid in pids if snapshot.comm(pid) in SHELL_NAMES]
 
 
 def _get_process_pts(pid: int) -> Optional[str]:
@@ -176,7 +258,7 @@ def _get_unique_pts(shell_pids: List[int]) -> Optional[str]:
     return None
 
 
-def _find_tmux_client(pids: List[int]) -> Optional[int]:
+def _find_tmux_client(pids: List[int], snapshot: Optional[_ProcSnapshot] = None) -> Optional[int]:
     """Find a tmux client process in the descendants.
 
     The tmux client ('tmux: client') is the process that connects a
@@ -185,17 +267,15 @@ def _find_tmux_client(pids: List[int]) -> Optional[int]:
 
     Args:
         pids: List of process IDs to check.
+        snapshot: Cached /proc reads to share with other helpers.
 
     Returns:
         PID of the tmux client, or None if not found.
     """
+    snapshot = snapshot or _ProcSnapshot()
     for pid in pids:
-        try:
-            comm = Path(f"/proc/{pid}/comm").read_text().strip()
-            if comm == 'tmux: client':
-                return pid
-        except OSError:
-            continue
+        if snapshot.comm(pid) == 'tmux: client':
+            return pid
     return None
 
 
@@ -217,7 +297,9 @@ def _filter_by_pts(pids: List[int], target_pts: str) -> List[int]:
     return result
 
 
-def _get_tmux_client_context(client_pid: int) -> Optional[TerminalContext]:
+def _get_tmux_client_context(
+    client_pid: int, snapshot: Optional[_ProcSnapshot] = None
+) -> Optional[TerminalContext]:
     """Get context from a specific tmux client.
 
     Queries tmux for the active pane that this client is currently viewing.
@@ -226,10 +308,12 @@ def _get_tmux_client_context(client_pid: int) -> Optional[TerminalContext]:
 
     Args:
         client_pid: PID of the tmux client process.
+        snapshot: Cached /proc reads to share with other helpers.
 
     Returns:
         TerminalContext from the client's active pane, or None if query fails.
     """
+    snapshot = snapshot or _ProcSnapshot()
     try:
         # Get this client's current pane info in a single query
         # Format: client_pid|session|pane_command|pane_path|pane_pid
@@ -271,7 +355,7 @@ def _get_tmux_client_context(client_pid: int) -> Optional[TerminalContext]:
             immediate_children = _get_immediate_children(pid)
             if immediate_children:
                 for child_pid in immediate_children:
-                    ctx = _get_process_context(child_pid)
+                    ctx = _get_process_context(child_pid, snapshot)
                     if ctx and ctx.foreground_process not in SHELL_NAMES:
                         foreground_process = ctx.foreground_process
                         full_command = ctx.full_command
@@ -282,7 +366,7 @@ def _get_tmux_client_context(client_pid: int) -> Optional[TerminalContext]:
         if pane_pid.isdigit():
             children = _get_descendant_pids(int(pane_pid))
 
-        shell = _find_shell_in_ancestry(int(pane_pid)) if pane_pid.isdigit() else "bash"
+        shell = _find_shell_in_ancestry(int(pane_pid), snapshot) if pane_pid.isdigit() else "bash"
         if not shell:
             shell = "bash"
 
@@ -291,7 +375,7 @@ def _get_tmux_client_context(client_pid: int) -> Optional[TerminalContext]:
             full_command=full_command,
             working_directory=pane_path,
             shell=shell,
-            is_ssh=_check_ssh_in_tree(children),
+            is_ssh=_check_ssh_in_tree(children, snapshot),
             tmux_session=session_name
         )
 
@@ -327,14 +411,17 @@ def get_terminal_context(window_pid: int, window_title: Optional[str] = None) ->
         or cannot be performed reliably (e.g., multi-window terminal).
     """
     try:
+        # Shared /proc reads for this pass; helpers check the same PIDs repeatedly
+        snapshot = _ProcSnapshot()
+
         # Get all descendant processes
         descendants = _get_descendant_pids(window_pid)
         if not descendants:
             # Terminal might be empty or just started
-            return _get_process_context(window_pid)
+            return _get_process_context(window_pid, snapshot)
 
         # Find all shell processes (these represent different terminal tabs/windows)
-        shell_descendants = _find_shell_descendants(descendants)
+        shell_descendants = _find_shell_descendants(descendants, snapshot)
 
         # Check if all shells share the same pts (single terminal case)
         # If multiple pts exist, we can't reliably determine which is focused
@@ -343,28 +430,28 @@ def get_terminal_context(window_pid: int, window_title: Optional[str] = None) ->
         if unique_pts:
             # Single terminal - safe to introspect
             # Check for tmux client
-            tmux_client_pid = _find_tmux_client(descendants)
+            tmux_client_pid = _find_tmux_client(descendants, snapshot)
             if tmux_client_pid:
-                tmux_context = _get_tmux_client_context(tmux_client_pid)
+                tmux_context = _get_tmux_client_context(tmux_client_pid, snapshot)
                 if tmux_context:
                     return tmux_context
 
             # No tmux - find foreground process
-            foreground_pid = _find_foreground_process(descendants)
+            foreground_pid = _find_foreground_process(descendants, snapshot)
             if foreground_pid is None:
                 foreground_pid = descendants[-1] if descendants else window_pid
 
-            context = _get_process_context(foreground_pid)
+            context = _get_process_context(foreground_pid, snapshot)
             if context is None:
                 return None
 
-            context.is_ssh = _check_ssh_in_tree(descendants)
-            context.tmux_session = _get_tmux_session(descendants)
+            context.is_ssh = _check_ssh_in_tree(descendants, snapshot)
+            context.tmux_session = _get_tmux_session(descendants, snapshot)
             return context
 
         # Multiple pts detected - multi-window terminal (like Tilix)
         # Try to match using window_title if available
-        interesting_contexts = _find_interesting_terminals(shell_descendants, descendants)
+        interesting_contexts = _find_interesting_terminals(shell_descendants, descendants, snapshot)
 
         if len(interesting_contexts) == 1:
             # Only one terminal has activity - safe to use
@@ -373,9 +460,9 @@ def get_terminal_context(window_pid: int, window_title: Optional[str] = None) ->
         if len(interesting_contexts) == 0:
             # All terminals are idle - pick any shell
             if shell_descendants:
-                context = _get_process_context(shell_descendants[0])
+                context = _get_process_context(shell_descendants[0], snapshot)
                 if context:
-                    context.is_ssh = _check_ssh_in_tree(descendants)
+                    context.is_ssh = _check_ssh_in_tree(descendants, snapshot)
                 return context
 
         # Multiple terminals have activity - try to match via window title
@@ -440,16 +527,22 @@ def _match_context_to_title(contexts: List[TerminalContext], window_title: str)
     return None
 
 
-def _find_interesting_terminals(shell_pids: List[int], all_descendants: List[int]) -> List[TerminalContext]:
+def _find_interesting_terminals(
+    shell_pids: List[int],
+    all_descendants: List[int],
+    snapshot: Optional[_ProcSnapshot] = None,
+) -> List[TerminalContext]:
     """Find terminals that have non-shell foreground processes.
 
     Args:
         shell_pids: List of shell process PIDs.
         all_descendants: All descendant PIDs of the terminal.
+        snapshot: Cached /proc reads to share with other helpers.
 
     Returns:
         List of TerminalContext for terminals with interesting activity.
     """
+    snapshot = snapshot or _ProcSnapshot()
     contexts = []
 
     for shell_pid in shell_pids:
@@ -461,30 +554,22 @@ def _find_interesting_terminals(shell_pids: List[int], all_descendants: List[int
         pts_descendants = _filter_by_pts(all_descendants, pts)
 
         # Check for tmux client on this pts
-        tmux_client = None
-        for pid in pts_descendants:
-            try:
-                comm = Path(f"/proc/{pid}/comm").read_text().strip()
-                if comm == 'tmux: client':
-                    tmux_client = pid
-                    break
-            except OSError:
-                continue
+        tmux_client = _find_tmux_client(pts_descendants, snapshot)
 
         if tmux_client:
             # This terminal has tmux - get tmux context
-            ctx = _get_tmux_client_context(tmux_client)
+            ctx = _get_tmux_client_context(tmux_client, snapshot)
             if ctx:
                 contexts.append(ctx)
             continue
 
         # Find foreground process on this pts
-        foreground_pid = _find_foreground_process(pts_descendants)
+        foreground_pid = _find_foreground_process(pts_descendants, snapshot)
         if foreground_pid:
-            ctx = _get_process_context(foreground_pid)
+            ctx = _get_process_context(foreground_pid, snapshot)
             if ctx and ctx.foreground_process not in SHELL_NAMES:
                 # Non-shell foreground - interesting
-                ctx.is_ssh = _check_ssh_in_tree(pts_descendants)
+                ctx.is_ssh = _check_ssh_in_tree(pts_descendants, snapshot)
                 contexts.append(ctx)
 
     return contexts
@@ -499,14 +584,12 @@ def _get_immediate_children(pid: int) -> List[int]:
     Returns:
         List of immediate child PIDs.
     """
-    try:
-        children_path = Path(f"/proc/{pid}/task/{pid}/children")
-        if children_path.exists():
-            children_str = children_path.read_text().strip()
-            if children_str:
-                return [int(p) for p in children_str.split()]
-    except (OSError, ValueError):
-        pass
+    data = _read_small(f"/proc/{pid}/task/{pid}/children")
+    if data:
+        try:
+            return [int(p) for p in data.split()]
+        except ValueError:
+            pass
     return []
 
 
@@ -532,16 +615,15 @@ def _get_descendant_pids(pid: int) -> List[int]:
         visited.add(current)
 
         # Find children of current
+        data = _read_small(f"/proc/{current}/task/{current}/children")
+        if not data:
+            continue
         try:
-            children_path = Path(f"/proc/{current}/task/{current}/children")
-            if children_path.exists():
-                children_str = children_path.read_text().strip()
-                if children_str:
-                    children = [int(p) for p in children_str.split()]
-                    descendants.extend(children)
-                    to_visit.extend(children)
-        except (OSError, ValueError):
+            children = [int(p) for p in data.split()]
+        except ValueError:
             continue
+        descendants.extend(children)
+        to_visit.extend(children)
 
     return descendants
 
@@ -558,23 +640,17 @@ def _process_in_tmux(pid: int) -> bool:
     Returns:
         True if the process has TMUX environment variable set.
     """
-    try:
-        env_path = Path(f"/proc/{pid}/environ")
-        if not env_path.exists():
-            return False
-        # Environment is null-separated key=value pairs
-        env_bytes = env_path.read_bytes()
-        env_str = env_bytes.decode('utf-8', errors='replace')
-        # Check for TMUX= in the environment
-        for entry in env_str.split('\x00'):
-            if entry.startswith('TMUX='):
-                return True
-        return False
-    except (OSError, PermissionError):
+    env_bytes = _read_small(f"/proc/{pid}/environ")
+    if not env_bytes:
         return False
+    # Environment is null-separated key=value pairs
+    for entry in env_bytes.split(b'\x00'):
+        if entry.startswith(b'TMUX='):
+            return True
+    return False
 
 
-def _any_shell_in_tmux(pids: List[int]) -> bool:
+def _any_shell_in_tmux(pids: List[int], snapshot: Optional[_ProcSnapshot] = None) -> bool:
     """Check if any shell process in the list is running inside tmux.
 
     This is more reliable than just checking for 'tmux' in process names,
@@ -583,76 +659,75 @@ def _any_shell_in_tmux(pids: List[int]) -> bool:
 
     Args:
         pids: List of process IDs to check.
+        snapshot: Cached /proc reads to share with other helpers.
 
     Returns:
         True if any shell process has TMUX environment variable.
     """
+    snapshot = snapshot or _ProcSnapshot()
     for pid in pids:
-        try:
-            comm = Path(f"/proc/{pid}/comm").read_text().strip()
-            if comm in SHELL_NAMES:
-                if _process_in_tmux(pid):
-                    return True
-        except OSError:
-            continue
+        if snapshot.comm(pid) in SHELL_NAMES and snapshot.in_tmux(pid):
+            return True
     return False
 
 
-def _find_foreground_process(pids: List[int]) -> Optional[int]:
+def _find_foreground_process(pids: List[int], snapshot: Optional[_ProcSnapshot] = None) -> Optional[int]:
     """Find the most interesting foreground process from a list of PIDs.
 
     Looks for the deepest process that isn't a shell or multiplexer.
 
     Args:
         pids: List of process IDs to examine.
+        snapshot: Cached /proc reads to share with other helpers.
 
     Returns:
         PID of the foreground process, or None if all are shells.
     """
+    snapshot = snapshot or _ProcSnapshot()
     # Work backwards (deepest processes first)
     for pid in reversed(pids):
-        try:
-            comm = Path(f"/proc/{pid}/comm").read_text().strip()
-            if comm not in SKIP_PROCESSES:
-                return pid
-        except OSError:
-            continue
+        comm = snapshot.comm(pid)
+        if comm is not None and comm not in SKIP_PROCESSES:
+            return pid
 
     return None
 
 
-def _get_process_context(pid: int) -> Optional[TerminalContext]:
+def _get_process_context(pid: int, snapshot: Optional[_ProcSnapshot] = None) -> Optional[TerminalContext]:
     """Get context information for a specific process.
 
     Args:
         pid: Process ID to inspect.
+        snapshot: Cached /proc reads to share with other helpers.
 
     Returns:
         TerminalContext with process details.
     """
+    snapshot = snapshot or _ProcSnapshot()
     try:
-        proc_path = Path(f"/proc/{pid}")
-
         # Get process name
-        comm = (proc_path / "comm").read_text().strip()
+        comm = snapshot.comm(pid)
+        if comm is None:
+            logger.debug(f"Failed to get process context for PID {pid}: process not found")
+            return None
 
         # Get full command line
-        try:
-            cmdline_bytes = (proc_path / "cmdline").read_bytes()
+        cmdline_bytes = _read_small(f"/proc/{pid}/cmdline")
+        if cmdline_bytes is not None:
             # cmdline is null-separated
             cmdline_parts = cmdline_bytes.decode('utf-8', errors='replace').split('\x00')
             full_command = ' '.join(p for p in cmdline_parts if p).strip()
-        except OSError:
+        else:
             full_command = comm
 
         # Get working directory
         try:
-            cwd = os.readlink(proc_path / "cwd")
+            cwd = os.readlink(f"/proc/{pid}/cwd")
         except OSError:
             cwd = ""
 
         # Determine shell (check parent processes)
-        shell = _find_shell_in_ancestry(pid)
+        shell = _find_shell_in_ancestry(pid, snapshot)
 
         return TerminalContext(
             foreground_process=comm,
@@ -668,62 +743,54 @@ def _get_process_context(pid: int) -> Optional[TerminalContext]:
         return None
 
 
-def _find_shell_in_ancestry(pid: int) -> Optional[str]:
+def _find_shell_in_ancestry(pid: int, snapshot: Optional[_ProcSnapshot] = None) -> Optional[str]:
     """Find the shell process in the ancestry of a PID.
 
     Args:
         pid: Process ID to start from.
+        snapshot: Cached /proc reads to share with other helpers.
 
     Returns:
         Shell name (bash, zsh, etc.) or None.
     """
+    snapshot = snapshot or _ProcSnapshot()
     current = pid
     visited = set()
 
     while current > 1 and current not in visited:
         visited.add(current)
-        try:
-            comm = Path(f"/proc/{current}/comm").read_text().strip()
-            if comm in SHELL_NAMES:
-                return comm
-
-            # Get parent PID
-            stat = Path(f"/proc/{current}/stat").read_text()
-            # stat format: pid (comm) state ppid ...
-            # Need to handle comm with spaces/parens
-            close_paren = stat.rfind(')')
-            ppid = int(stat[close_paren+2:].split()[1])
-            current = ppid
+        comm = snapshot.comm(current)
+        if comm is None:
+            break
+        if comm in SHELL_NAMES:
+            return comm
 
-        except (OSError, ValueError, IndexError):
+        # Walk up to the parent
+        ppid = snapshot.ppid(current)
+        if ppid is None:
             break
+        current = ppid
 
     return None
 
 
-def _check_ssh_in_tree(pids: List[int]) -> bool:
+def _check_ssh_in_tree(pids: List[int], snapshot: Optional[_ProcSnapshot] = None) -> bool:
     """Check if any process in the tree indicates an SSH session.
 
     Args:
         pids: List of process IDs to check.
+        snapshot: Cached /proc reads to share with other helpers.
 
     Returns:
         True if SSH is detected.
     """
     ssh_indicators = {'ssh', 'sshd', 'mosh-client', 'mosh-server'}
+    snapshot = snapshot or _ProcSnapshot()
 
-    for pid in pids:
-        try:
-            comm = Path(f"/proc/{pid}/comm").read_text().strip()
-            if comm in ssh_indicators:
-                return True
-        except OSError:
-            continue
-
-    return False
+    return any(snapshot.comm(pid) in ssh_indicators for pid in pids)
 
 
-def _get_tmux_session(pids: List[int]) -> Optional[str]:
+def _get_tmux_session(pids: List[int], snapshot: Optional[_ProcSnapshot] = None) -> Optional[str]:
     """Get tmux session name if running in tmux.
 
     Only queries tmux if a shell process in the list is actually inside
@@ -732,12 +799,13 @@ def _get_tmux_session(pids: List[int]) -> Optional[str]:
 
     Args:
         pids: List of process IDs to check.
+        snapshot: Cached /proc reads to share with other helpers.
 
     Returns:
         Tmux session name or None.
     """
     # Verify a shell is actually running inside tmux by checking env var
-    if not _any_shell_in_tmux(pids):
+    if not _any_shell_in_tmux(pids, snapshot):
         return None
 
     # Try to get current tmux session name
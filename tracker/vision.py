@@ -12,12 +12,14 @@ import base64
 import io
 import json
 import logging
+import os
 import shutil
 import subprocess
 import sys
 import tempfile
 import time
 from pathlib import Path
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +71,9 @@ except ImportError:
 # Default Ollama Docker container URL
 DEFAULT_OLLAMA_HOST = "http://localhost:11434"
 
+# How long a successful availability check is trusted before probing again
+AVAILABILITY_TTL_SECONDS = 5.0
+
 
 class HybridSummarizer:
     """
@@ -98,6 +103,7 @@ class HybridSummarizer:
         include_focus_context: bool = True,
         include_screenshots: bool = True,
         include_ocr: bool = True,
+        http_session: Optional["requests.Session"] = None,
     ):
         """
         Initialize the HybridSummarizer.
@@ -112,6 +118,9 @@ class HybridSummarizer:
             include_focus_context: Include window titles and duration info (default True).
             include_screenshots: Include screenshot images (default True).
             include_ocr: Include OCR text extraction (default True).
+            http_session: Optional shared requests.Session for Ollama calls, so
+                connections are pooled across summarizer instances. Defaults to
+                module-level requests (a new connection per call).
         """
         self.model = model
         self.timeout = timeout
@@ -122,6 +131,8 @@ class HybridSummarizer:
         self.include_focus_context = include_focus_context
         self.include_screenshots = include_screenshots
         self.include_ocr = include_ocr
+        self._http = http_session if http_session is not None else requests
+        self._available_until = 0.0  # time.monotonic() until which is_available() is cached
 
     def _call_ollama_api(
         self,
@@ -156,7 +167,7 @@ class HybridSummarizer:
 
         start_time = time.time()
         try:
-            response = requests.post(
+            response = self._http.post(
                 url,
                 json=payload,
                 timeout=self.timeout,
@@ -170,19 +181,23 @@ class HybridSummarizer:
             return result["message"]["content"]
 
         except requests.exceptions.Timeout:
+            self._available_until = 0.0
             inference_time = time.time() - start_time
             logger.error(f"Ollama API timed out after {inference_time:.2f}s")
             raise RuntimeError(f"Ollama API timed out after {self.timeout}s")
         except requests.exceptions.ConnectionError as e:
+            self._available_until = 0.0
             logger.error(f"Cannot connect to Ollama at {self.ollama_host}: {e}")
             raise RuntimeError(
                 f"Cannot connect to Ollama at {self.ollama_host}. "
                 "Ensure the Ollama Docker container is running."
             ) from e
         except requests.exceptions.HTTPError as e:
+            self._available_until = 0.0
             logger.error(f"Ollama API error: {e}")
             raise RuntimeError(f"Ollama API error: {e}") from e
         except Exception as e:
+            self._available_until = 0.0
             inference_time = time.time() - start_time
             logger.error(f"LLM inference failed after {inference_time:.2f}s: {e}")
             raise RuntimeError(f"Ollama inference failed: {e}") from e
@@ -1151,12 +1166,17 @@ class HybridSummarizer:
                     tmp_path = tmp.name
                     img.save(tmp_path, "PNG")
 
-            # Run tesseract
+            # Run tesseract single-threaded (unless the user set a limit):
+            # callers parallelize across images, which scales better than
+            # Tesseract's own OpenMP threading
+            env = dict(os.environ)
+            env.setdefault("OMP_THREAD_LIMIT", "1")
             result = subprocess.run(
                 ["tesseract", tmp_path, "stdout", "--psm", "3"],
                 capture_output=True,
                 text=True,
                 timeout=30,
+                env=env,
             )
 
             # Clean up temp file
@@ -1294,9 +1314,16 @@ class HybridSummarizer:
         1. Tesseract is installed and in PATH
         2. Ollama Docker container is running and the configured model is available
 
+        A successful check is cached for AVAILABILITY_TTL_SECONDS (and
+        dropped on any failed Ollama call), so back-to-back tasks don't each
+        probe Ollama.
+
         Returns:
             True if both dependencies are available, False otherwise.
         """
+        if time.monotonic() < self._available_until:
+            return True
+
         # Check tesseract
         tesseract_available = shutil.which("tesseract") is not None
         if not tesseract_available:
@@ -1306,7 +1333,7 @@ class HybridSummarizer:
         # Check Ollama via HTTP API (Docker container)
         try:
             # Check if Ollama is running
-            response = requests.get(
+            response = self._http.get(
                 f"{self.ollama_host}/api/tags",
                 timeout=5,
             )
@@ -1324,6 +1351,7 @@ class HybridSummarizer:
                 logger.warning(f"Model {self.model} not found in Ollama")
                 return False
 
+            self._available_until = time.monotonic() + AVAILABILITY_TTL_SECONDS
             return True
 
         except requests.exceptions.ConnectionError: